@@ -0,0 +1,28 @@
+"""Index foreign keys used by joins and cascades
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15
+
+Adds btree indexes on:
+- citations.statute_id
+- comparisons.citation_id
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_citations_statute_id', 'citations', ['statute_id'])
+    op.create_index('ix_comparisons_citation_id', 'comparisons', ['citation_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_comparisons_citation_id', table_name='comparisons')
+    op.drop_index('ix_citations_statute_id', table_name='citations')
@@ -0,0 +1,54 @@
+"""Use time-ordered UUIDv7 primary-key defaults
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15
+
+Postgres 16 has no built-in uuidv7() and the pg_uuidv7 extension is not
+shipped with the postgres:16-alpine image, so this defines an equivalent
+SQL function: a random v4 UUID with its first 48 bits replaced by the
+current Unix time in milliseconds and the version nibble set to 7.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ('documents', 'statutes', 'citations', 'comparisons')
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE
+    """)
+
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('uuid_generate_v7()'))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
@@ -0,0 +1,45 @@
+"""Reference the source statute from comparisons
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+
+Comparisons that leave the statute unchanged no longer store its full text;
+statute_id lets the text be resolved from the statutes table at read time.
+Existing rows keep their stored text and a NULL statute_id.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'comparisons',
+        sa.Column('statute_id', UUID(as_uuid=True), sa.ForeignKey('statutes.id'), nullable=True),
+    )
+    op.create_index('ix_comparisons_statute_id', 'comparisons', ['statute_id'])
+
+
+def downgrade() -> None:
+    # Restore the text that was resolved from the statute before dropping the link
+    op.execute("""
+        UPDATE comparisons c
+        SET original_text = s.full_text
+        FROM statutes s
+        WHERE c.statute_id = s.id AND c.original_text IS NULL
+    """)
+    op.execute("""
+        UPDATE comparisons
+        SET amended_text = original_text
+        WHERE amended_text IS NULL
+    """)
+    op.drop_index('ix_comparisons_statute_id', table_name='comparisons')
+    op.drop_column('comparisons', 'statute_id')
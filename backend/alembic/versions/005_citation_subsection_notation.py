@@ -0,0 +1,31 @@
+"""Store each citation's subsection notation
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15
+
+The notation (e.g. "(b)(1)" from section "1922(b)(1)") never changes after
+ingest, so it is computed once instead of on every comparison run.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('citations', sa.Column('subsection_notation', sa.String(100), nullable=True))
+    # Same run of parenthetical parts as SUBSECTION_NOTATION_PATTERN; NULL when absent
+    op.execute(r"""
+        UPDATE citations
+        SET subsection_notation = substring(section from '(?:\([^)]+\))+')
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('citations', 'subsection_notation')
@@ -0,0 +1,30 @@
+"""Compress large comparison text with lz4
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15
+
+Redline HTML is long and repetitive. Postgres already compresses large
+values in TOAST storage; lz4 compresses and decompresses faster than the
+default pglz. Existing rows keep their current compression until rewritten.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+COMPRESSED_COLUMNS = ['diff_html', 'original_text', 'amended_text']
+
+
+def upgrade() -> None:
+    for column in COMPRESSED_COLUMNS:
+        op.execute(f"ALTER TABLE comparisons ALTER COLUMN {column} SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    for column in COMPRESSED_COLUMNS:
+        op.execute(f"ALTER TABLE comparisons ALTER COLUMN {column} SET COMPRESSION default")
@@ -0,0 +1,31 @@
+"""Cover statute cache lookups with one index
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15
+
+Statute lookups filter on (citation_type, title, section) and check
+expires_at. Indexing expiry and including id lets both the cache check
+and the id lookup run as index-only scans.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_statute_lookup',
+        'statutes',
+        ['citation_type', 'title', 'section', 'expires_at'],
+        postgresql_include=['id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_statute_lookup', table_name='statutes')
@@ -0,0 +1,33 @@
+"""Generate document and statute timestamps in the database
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15
+
+created_at on documents and fetched_at on statutes were filled in by
+Python on every insert. They now come from server defaults in naive UTC,
+matching the existing values. expires_at keeps no server default: the
+application sends it with each insert, so the retention settings are
+never baked into the schema.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+UTC_NOW = "timezone('utc', now())"
+
+
+def upgrade() -> None:
+    op.alter_column('documents', 'created_at', server_default=sa.text(UTC_NOW))
+    op.alter_column('statutes', 'fetched_at', server_default=sa.text(UTC_NOW))
+
+
+def downgrade() -> None:
+    op.alter_column('statutes', 'fetched_at', server_default=None)
+    op.alter_column('documents', 'created_at', server_default=None)
@@ -0,0 +1,27 @@
+"""Record when comparison generation claimed a document
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+
+Comparisons are generated in a background task. processing_started_at
+marks which run owns a document in the processing state, so a run lost
+to a worker restart can be reclaimed once it is stale.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('documents', sa.Column('processing_started_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('documents', 'processing_started_at')
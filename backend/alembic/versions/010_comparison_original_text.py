@@ -0,0 +1,33 @@
+"""Store the original text on every comparison
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16
+
+Comparisons that left the statute unchanged stored NULL original_text and
+resolved it from the statute at read time. Statutes are refreshed in place,
+so that text could drift from the diff it was built from. Fill in the
+remaining NULLs from the statute; new rows always store the text.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        UPDATE comparisons c
+        SET original_text = s.full_text
+        FROM statutes s
+        WHERE c.statute_id = s.id AND c.original_text IS NULL
+    """)
+
+
+def downgrade() -> None:
+    # Rows written with the text stay valid for the older read path
+    pass
@@ -4,24 +4,96 @@ Citation API endpoints
 Handles fetching statute text for citations.
 """
 
+import asyncio
 import logging
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, List, Tuple
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import DateTime, String, and_, bindparam, cast, func, lambda_stmt, select, tuple_, update
+from sqlalchemy.orm import selectinload
 
+from app.core.config import settings
 from app.db.session import get_db
-from app.models import Citation, Statute, StatuteSource
-from app.schemas import CitationFetchResponse
+from app.models import Document, Citation, Statute, StatuteSource
+from app.models.citation import format_canonical_citation
+from app.schemas import CitationFetchResponse, DocumentStatuteFetchResponse
 from app.services import StatuteFetcherService
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/citations", tags=["citations"])
+document_router = APIRouter(prefix="/documents", tags=["citations"])
 
 # Initialize the statute fetcher service
 statute_fetcher = StatuteFetcherService()
 
+# Maximum concurrent upstream requests when fetching a whole document
+FETCH_CONCURRENCY = 10
+
+# Statements built once per process; lambda_stmt caches their construction
+# and compiled form, so each request only binds parameters.
+
+# Citation plus its unexpired cached statute, if any
+_CITATION_WITH_CACHED_STATUTE = lambda_stmt(
+    lambda: select(Citation, Statute)
+    .outerjoin(
+        Statute,
+        and_(
+            Statute.citation_type == cast(Citation.citation_type, String),
+            Statute.title == Citation.title,
+            Statute.section == Citation.section,
+            # Expired entries don't join, so they fall through to a refetch
+            Statute.expires_at > func.timezone('utc', func.now()),
+        ),
+    )
+    .where(Citation.id == bindparam("citation_id"))
+)
+
+# Cached statute row for a citation key, regardless of expiry
+_STATUTE_ID_BY_KEY = lambda_stmt(
+    lambda: select(Statute.id).where(
+        Statute.citation_type == bindparam("citation_type"),
+        Statute.title == bindparam("title"),
+        Statute.section == bindparam("section"),
+    )
+)
+
+# Only the columns get_citation returns; the context is truncated in SQL
+_CITATION_DETAIL = lambda_stmt(
+    lambda: select(
+        Citation.id,
+        Citation.document_id,
+        Citation.citation_type,
+        Citation.title,
+        Citation.section,
+        Citation.subsection,
+        Citation.raw_text,
+        Citation.statute_fetched,
+        func.substr(Citation.context_text, 1, 500).label("context_text"),
+    ).where(Citation.id == bindparam("citation_id"))
+)
+
+
+def _statute_cache_times() -> Tuple:
+    """
+    (fetched_at, expires_at) for a refreshed statute, from the database clock.
+
+    Matches the column defaults used on INSERT, so refreshed and new rows
+    never mix application and database time.
+    """
+    now = func.timezone('utc', func.now(), type_=DateTime)
+    return now, now + timedelta(days=settings.STATUTE_CACHE_DAYS)
+
+
+# Statute source for each citation type; anything else is MANUAL
+_SOURCE_BY_CITATION_TYPE = {
+    "usc": StatuteSource.GOVINFO,
+    "cfr": StatuteSource.ECFR,
+}
+
 
 @router.post("/{citation_id}/fetch-statute", response_model=CitationFetchResponse)
 async def fetch_statute_for_citation(
@@ -34,29 +106,22 @@ async def fetch_statute_for_citation(
     Retrieves the official text from govinfo.gov (USC) or eCFR.gov (CFR)
     and caches it for future use.
     """
-    # Get citation
-    result = await db.execute(
-        select(Citation).where(Citation.id == citation_id)
-    )
-    citation = result.scalar_one_or_none()
+    # Get citation together with any cached statute in one round trip
+    result = await db.execute(_CITATION_WITH_CACHED_STATUTE, {"citation_id": citation_id})
+    row = result.first()
 
-    if not citation:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Citation not found"
         )
 
-    # Check if statute already exists in cache
-    existing_result = await db.execute(
-        select(Statute).where(
-            Statute.citation_type == citation.citation_type.value,
-            Statute.title == citation.title,
-            Statute.section == citation.section,
-        )
-    )
-    existing_statute = existing_result.scalar_one_or_none()
+    citation, existing_statute = row
+    citation_type = citation.citation_type.value
+    title = citation.title
+    section = citation.section
 
-    if existing_statute and not existing_statute.is_expired:
+    if existing_statute:
         # Use cached statute
         citation.statute_id = existing_statute.id
         citation.statute_fetched = True
@@ -74,9 +139,9 @@ async def fetch_statute_for_citation(
     try:
         # Fetch from official API
         fetched = await statute_fetcher.fetch(
-            citation_type=citation.citation_type.value,
-            title=citation.title,
-            section=citation.section
+            citation_type=citation_type,
+            title=title,
+            section=section
         )
 
         if not fetched.success:
@@ -89,26 +154,36 @@ async def fetch_statute_for_citation(
                 message=f"Could not fetch statute: {fetched.error_message}"
             )
 
-        # Determine source based on citation type
-        if citation.citation_type.value == "usc":
-            source = StatuteSource.GOVINFO
-        elif citation.citation_type.value == "cfr":
-            source = StatuteSource.ECFR
-        else:
-            source = StatuteSource.MANUAL
-
-        # Create or update statute in cache
-        if existing_statute:
-            existing_statute.full_text = fetched.full_text
-            existing_statute.heading = fetched.heading
-            existing_statute.source = source
-            existing_statute.source_url = fetched.source_url
-            statute = existing_statute
+        source = _SOURCE_BY_CITATION_TYPE.get(citation_type, StatuteSource.MANUAL)
+
+        # Refresh the expired cache entry in place, or create a new one
+        expired_result = await db.execute(_STATUTE_ID_BY_KEY, {
+            "citation_type": citation_type,
+            "title": title,
+            "section": section,
+        })
+        expired_statute_id = expired_result.scalar_one_or_none()
+
+        if expired_statute_id:
+            fetched_at, expires_at = _statute_cache_times()
+            await db.execute(
+                update(Statute)
+                .where(Statute.id == expired_statute_id)
+                .values(
+                    full_text=fetched.full_text,
+                    heading=fetched.heading,
+                    source=source,
+                    source_url=fetched.source_url,
+                    fetched_at=fetched_at,
+                    expires_at=expires_at,
+                )
+            )
+            statute_id = expired_statute_id
         else:
             statute = Statute(
-                citation_type=citation.citation_type.value,
-                title=citation.title,
-                section=citation.section,
+                citation_type=citation_type,
+                title=title,
+                section=section,
                 full_text=fetched.full_text,
                 heading=fetched.heading,
                 source=source,
@@ -116,9 +191,10 @@ async def fetch_statute_for_citation(
             )
             db.add(statute)
             await db.flush()
+            statute_id = statute.id
 
         # Link citation to statute
-        citation.statute_id = statute.id
+        citation.statute_id = statute_id
         citation.statute_fetched = True
         await db.commit()
 
@@ -148,10 +224,8 @@ async def get_citation(
     """
     Get citation details.
     """
-    result = await db.execute(
-        select(Citation).where(Citation.id == citation_id)
-    )
-    citation = result.scalar_one_or_none()
+    result = await db.execute(_CITATION_DETAIL, {"citation_id": citation_id})
+    citation = result.first()
 
     if not citation:
         raise HTTPException(
@@ -167,7 +241,147 @@ async def get_citation(
         "section": citation.section,
         "subsection": citation.subsection,
         "raw_text": citation.raw_text,
-        "canonical_citation": citation.canonical_citation,
+        "canonical_citation": format_canonical_citation(
+            citation.citation_type, citation.title, citation.section,
+            citation.subsection, citation.raw_text,
+        ),
         "statute_fetched": citation.statute_fetched,
-        "context_text": citation.context_text[:500] if citation.context_text else None,
+        "context_text": citation.context_text or None,
     }
+
+
+@document_router.post("/{document_id}/fetch-all-statutes", response_model=DocumentStatuteFetchResponse)
+async def fetch_all_statutes_for_document(
+    document_id: UUID,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Fetch the current statute text for every citation in a document.
+
+    Citations that share a statute are fetched once, and uncached statutes
+    are fetched concurrently (up to FETCH_CONCURRENCY at a time).
+    """
+    result = await db.execute(
+        select(Document)
+        .options(selectinload(Document.citations).raiseload('*'))
+        .where(Document.id == document_id)
+    )
+    document = result.scalar_one_or_none()
+
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document not found"
+        )
+
+    # Group citations by the statute they reference
+    citations_by_key: Dict[Tuple[str, int, str], List[Citation]] = defaultdict(list)
+    for citation in document.citations:
+        citations_by_key[(citation.citation_type.value, citation.title, citation.section)].append(citation)
+
+    # Load cached statutes for all keys in one query, checking expiry
+    # against the database clock
+    cached: Dict[Tuple[str, int, str], Statute] = {}
+    statutes_by_key: Dict[Tuple[str, int, str], Statute] = {}
+    if citations_by_key:
+        cached_result = await db.execute(
+            select(Statute, Statute.expires_at > func.timezone('utc', func.now())).where(
+                tuple_(Statute.citation_type, Statute.title, Statute.section).in_(list(citations_by_key))
+            )
+        )
+        for s, is_current in cached_result.tuples():
+            key = (s.citation_type, s.title, s.section)
+            cached[key] = s
+            if is_current:
+                statutes_by_key[key] = s
+
+    messages = {key: "Statute retrieved from cache" for key in statutes_by_key}
+
+    # Fetch missing and expired statutes concurrently
+    to_fetch = [key for key in citations_by_key if key not in statutes_by_key]
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+    async def fetch_one(key: Tuple[str, int, str]):
+        async with semaphore:
+            return await statute_fetcher.fetch(*key)
+
+    fetch_results = await asyncio.gather(*(fetch_one(key) for key in to_fetch), return_exceptions=True)
+
+    try:
+        for key, fetched in zip(to_fetch, fetch_results):
+            if isinstance(fetched, Exception):
+                logger.error(f"Error fetching statute {key} for document {document_id}: {fetched}")
+                messages[key] = f"Could not fetch statute: {fetched}"
+                continue
+            if not fetched.success:
+                logger.warning(f"Failed to fetch statute {key} for document {document_id}: {fetched.error_message}")
+                messages[key] = f"Could not fetch statute: {fetched.error_message}"
+                continue
+
+            source = _SOURCE_BY_CITATION_TYPE.get(key[0], StatuteSource.MANUAL)
+            statute = cached.get(key)
+            if statute:
+                # Refresh the expired cache entry in place
+                statute.full_text = fetched.full_text
+                statute.heading = fetched.heading
+                statute.source = source
+                statute.source_url = fetched.source_url
+                statute.fetched_at, statute.expires_at = _statute_cache_times()
+            else:
+                citation_type, title, section = key
+                statute = Statute(
+                    citation_type=citation_type,
+                    title=title,
+                    section=section,
+                    full_text=fetched.full_text,
+                    heading=fetched.heading,
+                    source=source,
+                    source_url=fetched.source_url,
+                )
+                db.add(statute)
+
+            statutes_by_key[key] = statute
+            messages[key] = f"Statute fetched successfully from {source.value}"
+
+        await db.flush()
+
+        # Link citations to their statutes with one UPDATE per statute
+        for key, statute in statutes_by_key.items():
+            await db.execute(
+                update(Citation)
+                .where(Citation.id.in_([c.id for c in citations_by_key[key]]))
+                .values(statute_id=statute.id, statute_fetched=True)
+            )
+        await db.commit()
+
+    except Exception as e:
+        logger.error(f"Error saving statutes for document {document_id}: {e}")
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch statutes: {str(e)}"
+        )
+
+    # Values come from typed columns and our own messages, so skip
+    # validating every row
+    results = []
+    for citation in document.citations:
+        key = (citation.citation_type.value, citation.title, citation.section)
+        statute = statutes_by_key.get(key)
+        results.append(CitationFetchResponse.model_construct(
+            citation_id=citation.id,
+            statute_fetched=statute is not None,
+            statute_heading=statute.heading if statute else None,
+            message=messages[key],
+        ))
+
+    fetched_count = sum(1 for r in results if r.statute_fetched)
+    logger.info(f"Fetched statutes for {fetched_count}/{len(results)} citations in document {document_id}")
+
+    return DocumentStatuteFetchResponse.model_construct(
+        document_id=document.id,
+        total=len(results),
+        fetched=fetched_count,
+        failed=len(results) - fetched_count,
+        results=results,
+    )
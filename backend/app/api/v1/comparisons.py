@@ -4,18 +4,27 @@ Comparison API endpoints
 Handles generating and retrieving redline comparisons.
 """
 
+import asyncio
+import hashlib
 import logging
+import re
+import threading
+from datetime import datetime, timedelta
+from typing import Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from cachetools import LRUCache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.orm import raiseload, selectinload
 
-from app.db.session import get_db
-from app.models import Document, DocumentStatus, Citation, Comparison, AmendmentType
+from app.core.config import settings
+from app.db.bulk import bulk_insert
+from app.db.session import async_session_maker, get_db
+from app.models import Document, DocumentStatus, Citation, Comparison, Statute, AmendmentType
 from app.schemas import ComparisonListResponse, ComparisonBase, CompareRequest
-from app.services import AmendmentParser, AmendmentApplier, DiffGenerator, generate_redline_html, SubsectionExtractor
+from app.services import AmendmentParser, AmendmentApplier, generate_redline_html, generate_unchanged_html, SubsectionExtractor
 from app.services.amendment_parser import AmendmentType as ParsedAmendmentType
 
 logger = logging.getLogger(__name__)
@@ -24,30 +33,52 @@ router = APIRouter(prefix="/documents", tags=["comparisons"])
 # Initialize services
 amendment_parser = AmendmentParser()
 amendment_applier = AmendmentApplier()
-diff_generator = DiffGenerator()
 subsection_extractor = SubsectionExtractor()
 
+# Rendered redline HTML shared across requests; comparisons are built in
+# worker threads, so access is locked
+_redline_cache: LRUCache = LRUCache(maxsize=2048)
+_redline_cache_lock = threading.Lock()
 
-def _extract_subsection_notation(section: str) -> str:
+# Extracted subsection text, keyed by (statute id, fetched_at, notation)
+_subsection_cache: LRUCache = LRUCache(maxsize=1024)
+_subsection_cache_lock = threading.Lock()
+
+# Citations loaded and built per round while generating comparisons
+_COMPARISON_BATCH_SIZE = 64
+
+# Characters of each text shown in a redline
+_REDLINE_MAX_LENGTH = 5000
+
+# First designation in an amendment target, e.g. "D" in "subparagraph (D)"
+_TARGET_NOTATION_PATTERN = re.compile(r'\(([A-Za-z0-9]+)\)')
+
+
+def _extract_subsection(statute: Statute, notation: str) -> str:
     """
-    Extract subsection notation from a section string.
+    Extract a subsection from a statute, reusing earlier results.
+
+    Several citations often target the same subsection of one statute.
+    Results are keyed by statute id and fetch time, so a refreshed statute
+    never serves stale text.
 
-    Examples:
-        "1922(b)(1)" -> "(b)(1)"
-        "1923(a)" -> "(a)"
-        "501" -> ""
+    Returns:
+        The subsection text, or "" if it could not be found
     """
-    import re
-    # Find all parenthetical parts
-    match = re.search(r'(\([^)]+\))+', section)
-    if match:
-        return match.group(0)
-    return ""
+    key = (statute.id, statute.fetched_at, notation)
+    with _subsection_cache_lock:
+        extracted = _subsection_cache.get(key)
+    if extracted is None:
+        result = subsection_extractor.extract(statute.full_text, notation)
+        extracted = result.extracted_text if result.success else ""
+        with _subsection_cache_lock:
+            _subsection_cache[key] = extracted
+    return extracted
 
 
 def _get_target_text_for_amendment(
-    full_statute_text: str,
-    section: str,
+    statute: Statute,
+    subsection_notation: str,
     parsed_amendment
 ) -> tuple:
     """
@@ -62,28 +93,272 @@ def _get_target_text_for_amendment(
     # Check if the parsed amendment has a target section (e.g., "subparagraph (D)")
     if parsed_amendment and parsed_amendment.target_section:
         # Extract the target notation from the amendment
-        import re
-        target_match = re.search(r'\(([A-Za-z0-9]+)\)', parsed_amendment.target_section)
+        target_match = _TARGET_NOTATION_PATTERN.search(parsed_amendment.target_section)
         if target_match:
             target_notation = f"({target_match.group(1)})"
-            result = subsection_extractor.extract(full_statute_text, target_notation)
-            if result.success and result.extracted_text:
-                return result.extracted_text, target_notation, True
+            extracted = _extract_subsection(statute, target_notation)
+            if extracted:
+                return extracted, target_notation, True
 
     # Try to extract from the citation's subsection notation
-    subsection_notation = _extract_subsection_notation(section)
     if subsection_notation:
-        result = subsection_extractor.extract(full_statute_text, subsection_notation)
-        if result.success and result.extracted_text:
-            return result.extracted_text, subsection_notation, True
+        extracted = _extract_subsection(statute, subsection_notation)
+        if extracted:
+            return extracted, subsection_notation, True
 
     # Fall back to full text
-    return full_statute_text, "", False
+    return statute.full_text, "", False
+
+
+def _cached_redline_html(original_text: str, amended_text: str, label: str) -> str:
+    """
+    Render redline HTML, reusing output for identical inputs.
+
+    Citations often repeat the same subsection and amendment, so the
+    result is memoized process-wide by a digest of both texts and the label.
+    """
+    # Cut both texts once up front, as the diff would, so hashing and
+    # diffing only ever see the displayed prefix
+    if original_text and amended_text:
+        original_text = original_text[:_REDLINE_MAX_LENGTH]
+        amended_text = amended_text[:_REDLINE_MAX_LENGTH]
+
+    digest = hashlib.blake2b(digest_size=16)
+    for text in (original_text, amended_text):
+        data = text.encode("utf-8")
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    key = (digest.digest(), label)
+
+    with _redline_cache_lock:
+        diff_html = _redline_cache.get(key)
+    if diff_html is None:
+        diff_html = generate_redline_html(
+            original_text, amended_text,
+            amendment_type=label,
+            max_length=_REDLINE_MAX_LENGTH
+        )
+        with _redline_cache_lock:
+            _redline_cache[key] = diff_html
+    return diff_html
+
+
+def _build_comparison(document_id: UUID, citation: Citation, statute: Statute) -> Tuple[dict, bool]:
+    """
+    Parse, apply, and diff the amendment for a single citation.
+
+    Pure CPU work on already-loaded objects, so it is safe to run in a
+    worker thread.
+
+    Returns:
+        Tuple of (comparison row values, is_definitional_reference)
+    """
+    # Parse amendments from the citation context
+    context_text = citation.context_text or ""
+
+    # Check if this is a definitional reference (not an actual amendment)
+    classification = amendment_parser.classify(context_text)
+    if classification.is_definitional:
+        logger.info(f"Skipping definitional reference for {citation.canonical_citation}")
+        # Still create a comparison record but mark it as definitional
+        return dict(
+            document_id=document_id,
+            citation_id=citation.id,
+            statute_id=statute.id,
+            citation_text=citation.canonical_citation,
+            amendment_type=AmendmentType.UNKNOWN,
+            amendment_instruction="(Definitional reference - no amendment)",
+            original_text=statute.full_text[:2000],  # Truncate for definitional refs
+            amended_text=statute.full_text[:2000],
+            diff_html=generate_unchanged_html(
+                statute.full_text,
+                "This citation is a definitional reference. The statute is shown for context but no amendments were detected.",
+                max_length=2000,
+            ),
+        ), True
+
+    parse_result = classification.parse_result
+
+    # Determine amendment type and apply changes
+    full_statute_text = statute.full_text
+    amendment_type = AmendmentType.UNKNOWN
+    amendment_instruction = ""
+    subsection_notation = ""
+    used_subsection = False
+
+    if parse_result.success and parse_result.amendments:
+        # Use the first valid amendment found
+        for parsed in parse_result.amendments:
+            if parsed.is_valid:
+                # Map parsed type to model type
+                amendment_type = _map_amendment_type(parsed.amendment_type)
+                amendment_instruction = parsed.raw_instruction
+
+                # Get the target text (subsection or full text)
+                target_text, subsection_notation, used_subsection = _get_target_text_for_amendment(
+                    statute,
+                    citation.subsection_notation or "",
+                    parsed
+                )
+
+                if used_subsection:
+                    logger.info(f"Extracted subsection {subsection_notation} for {citation.canonical_citation}")
+
+                # Apply the amendment to the target text
+                amended_text, success = amendment_applier.apply(target_text, parsed)
+
+                if success:
+                    logger.info(f"Applied {amendment_type.value} amendment for {citation.canonical_citation}")
+                    # Use subsection text for comparison (cleaner diff)
+                    original_text = target_text
+                else:
+                    logger.warning(f"Could not apply amendment for {citation.canonical_citation}")
+                    # Fall back to full text
+                    original_text = full_statute_text
+                    amended_text = full_statute_text
+                break
+        else:
+            # No valid amendments found
+            original_text = full_statute_text
+            amended_text = full_statute_text
+    else:
+        # Fallback to keyword detection
+        amendment_type = _detect_amendment_type(context_text)
+
+        # Still try to extract subsection for better context
+        subsection_notation = citation.subsection_notation or ""
+        if subsection_notation:
+            extracted = _extract_subsection(statute, subsection_notation)
+            if extracted:
+                original_text = extracted
+                amended_text = extracted
+                used_subsection = True
+            else:
+                original_text = full_statute_text
+                amended_text = full_statute_text
+        else:
+            original_text = full_statute_text
+            amended_text = full_statute_text
+
+    # Add subsection context to diff if used
+    subsection_info = f" (subsection {subsection_notation})" if used_subsection else ""
+    diff_html = _cached_redline_html(
+        original_text, amended_text, amendment_type.value + subsection_info
+    )
+
+    # Build comparison record. The statute row is refreshed in place, so
+    # the original text is always stored; only a repeat of it is left out
+    unchanged = amended_text == original_text
+    return dict(
+        document_id=document_id,
+        citation_id=citation.id,
+        statute_id=statute.id,
+        citation_text=citation.canonical_citation,
+        amendment_type=amendment_type,
+        amendment_instruction=amendment_instruction[:500] if amendment_instruction else None,
+        original_text=original_text,
+        amended_text=None if unchanged else amended_text,
+        diff_html=diff_html,
+    ), False
+
+
+def _finish_run(document_id: UUID, claimed_at: datetime, **values):
+    """UPDATE setting values on the document if this run still owns it."""
+    return (
+        update(Document)
+        .where(Document.id == document_id, Document.processing_started_at == claimed_at)
+        .values(**values)
+        .returning(Document.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def _run_comparisons(document_id: UUID, claimed_at: datetime) -> None:
+    """
+    Build and store comparisons for a document, then mark it completed.
+
+    Runs after the compare request has returned, so it opens its own
+    session and records failures on the document instead of raising.
+    The document's previous comparisons are replaced in the same
+    transaction, so they survive a failed run. claimed_at identifies the
+    run; if the document was reclaimed by a newer run in the meantime,
+    this run's work is discarded.
+    """
+    async with async_session_maker() as db:
+        try:
+            document_exists = await db.scalar(
+                select(Document.id).where(Document.id == document_id)
+            )
+            if not document_exists:
+                logger.warning(f"Document {document_id} no longer exists; skipping comparisons")
+                return
+
+            comparisons_created = 0
+            skipped_definitional = 0
+
+            await db.execute(
+                delete(Comparison).where(Comparison.document_id == document_id)
+            )
+
+            # Stream citations with their statutes in partitions so the
+            # working set stays bounded however many citations a bill has;
+            # any other relationship access raises instead of lazy-loading
+            stream = await db.stream_scalars(
+                select(Citation)
+                .options(
+                    selectinload(Citation.statute).raiseload('*'),
+                    raiseload('*'),
+                )
+                .where(
+                    Citation.document_id == document_id,
+                    Citation.statute_id.is_not(None),
+                )
+                .execution_options(yield_per=_COMPARISON_BATCH_SIZE)
+            )
+            async for citations in stream.partitions():
+                # Per-citation work is CPU-bound and independent, so run it in
+                # worker threads to keep the event loop free
+                built = await asyncio.gather(*(
+                    asyncio.to_thread(_build_comparison, document_id, citation, citation.statute)
+                    for citation in citations
+                ))
+                await bulk_insert(db, Comparison, [row for row, _ in built])
+                comparisons_created += len(built)
+                skipped_definitional += sum(1 for _, is_definitional in built if is_definitional)
+
+                for citation in citations:
+                    db.expunge(citation)
+
+            finished = await db.scalar(
+                _finish_run(document_id, claimed_at, status=DocumentStatus.COMPLETED)
+            )
+            if not finished:
+                await db.rollback()
+                logger.warning(f"Comparison run for document {document_id} was superseded; discarding its results")
+                return
+            await db.commit()
+
+            logger.info(f"Generated {comparisons_created} comparisons for document {document_id} ({skipped_definitional} definitional references)")
+
+        except Exception as e:
+            logger.error(f"Error generating comparisons for document {document_id}: {e}")
+            try:
+                await db.rollback()
+                await db.scalar(_finish_run(
+                    document_id, claimed_at,
+                    status=DocumentStatus.FAILED,
+                    error_message=f"Failed to generate comparisons: {str(e)}",
+                ))
+                await db.commit()
+            except Exception as record_error:
+                logger.error(f"Could not record comparison failure for document {document_id}: {record_error}")
 
 
 @router.post("/{document_id}/compare")
 async def generate_comparisons(
     document_id: UUID,
+    background_tasks: BackgroundTasks,
+    response: Response,
     request: CompareRequest = CompareRequest(),
     db: AsyncSession = Depends(get_db)
 ):
@@ -92,15 +367,17 @@ async def generate_comparisons(
 
     Analyzes each citation's context to detect amendments, then applies
     changes to the original statute text and generates diff HTML.
+
+    The work runs after the response is sent: the endpoint returns 202
+    with status "processing", and clients poll GET /documents/{id} until
+    the status becomes "completed" or "failed". Returns 409 while another
+    run is in progress; a run that has not finished within
+    COMPARISON_TIMEOUT_MINUTES is treated as lost and can be replaced.
     """
-    # Get document with citations
     result = await db.execute(
-        select(Document)
-        .options(selectinload(Document.citations))
-        .options(selectinload(Document.comparisons))
-        .where(Document.id == document_id)
+        select(Document.id, Document.status).where(Document.id == document_id)
     )
-    document = result.scalar_one_or_none()
+    document = result.one_or_none()
 
     if not document:
         raise HTTPException(
@@ -108,183 +385,86 @@ async def generate_comparisons(
             detail="Document not found"
         )
 
-    if document.status not in [DocumentStatus.PARSED, DocumentStatus.COMPLETED]:
+    if document.status not in [DocumentStatus.PARSED, DocumentStatus.COMPLETED, DocumentStatus.PROCESSING]:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Document must be parsed before comparison"
         )
 
     # Check if all citations have statutes fetched
-    unfetched = [c for c in document.citations if not c.statute_fetched]
-    if unfetched:
+    unfetched_result = await db.execute(
+        select(func.count())
+        .select_from(Citation)
+        .where(Citation.document_id == document.id, Citation.statute_fetched.is_not(True))
+    )
+    unfetched_count = unfetched_result.scalar_one()
+    if unfetched_count:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"{len(unfetched)} citation(s) need statute text fetched first"
+            detail=f"{unfetched_count} citation(s) need statute text fetched first"
         )
 
-    # Delete existing comparisons if force_refresh
-    if request.force_refresh and document.comparisons:
-        for comp in document.comparisons:
-            await db.delete(comp)
-        await db.flush()
+    # Count existing comparisons without loading their text
+    count_result = await db.execute(
+        select(func.count())
+        .select_from(Comparison)
+        .where(Comparison.document_id == document.id)
+    )
+    existing_count = count_result.scalar_one()
 
     # Skip if comparisons already exist
-    if document.comparisons and not request.force_refresh:
+    if document.status == DocumentStatus.COMPLETED and existing_count and not request.force_refresh:
         return {
             "document_id": document.id,
+            "status": document.status,
             "message": "Comparisons already exist",
-            "comparisons_count": len(document.comparisons)
+            "comparisons_count": existing_count
         }
 
-    document.status = DocumentStatus.PROCESSING
+    # Claim the document in one conditional UPDATE so concurrent requests
+    # can't both start a run; a processing run past the timeout is reclaimed
+    now = func.timezone('utc', func.now())
+    stale_before = now - timedelta(minutes=settings.COMPARISON_TIMEOUT_MINUTES)
+    claimed_at = await db.scalar(
+        update(Document)
+        .where(
+            Document.id == document.id,
+            or_(
+                Document.status.in_([DocumentStatus.PARSED, DocumentStatus.COMPLETED]),
+                and_(
+                    Document.status == DocumentStatus.PROCESSING,
+                    or_(
+                        Document.processing_started_at.is_(None),
+                        Document.processing_started_at < stale_before,
+                    ),
+                ),
+            ),
+        )
+        .values(
+            status=DocumentStatus.PROCESSING,
+            error_message=None,
+            processing_started_at=now,
+        )
+        .returning(Document.processing_started_at)
+        .execution_options(synchronize_session=False)
+    )
+    if claimed_at is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Comparisons are already being generated for this document"
+        )
     await db.commit()
 
-    try:
-        comparisons_created = 0
-        skipped_definitional = 0
-
-        for citation in document.citations:
-            # Get the statute text
-            statute_result = await db.execute(
-                select(Statute).where(Statute.id == citation.statute_id)
-            )
-            statute = statute_result.scalar_one_or_none()
-
-            if not statute:
-                continue
-
-            # Parse amendments from the citation context
-            context_text = citation.context_text or ""
-
-            # Check if this is a definitional reference (not an actual amendment)
-            if amendment_parser.is_definitional_reference(context_text) and not amendment_parser.is_amendment_context(context_text):
-                logger.info(f"Skipping definitional reference for {citation.canonical_citation}")
-                skipped_definitional += 1
-                # Still create a comparison record but mark it as definitional
-                comparison = Comparison(
-                    document_id=document.id,
-                    citation_id=citation.id,
-                    citation_text=citation.canonical_citation,
-                    amendment_type=AmendmentType.UNKNOWN,
-                    amendment_instruction="(Definitional reference - no amendment)",
-                    original_text=statute.full_text[:2000],  # Truncate for definitional refs
-                    amended_text=statute.full_text[:2000],
-                    diff_html=f'<div class="redline-container"><p class="redline-note">This citation is a definitional reference. The statute is shown for context but no amendments were detected.</p><div class="redline-content">{statute.full_text[:2000]}...</div></div>',
-                )
-                db.add(comparison)
-                comparisons_created += 1
-                continue
-
-            parse_result = amendment_parser.parse(context_text)
-
-            # Determine amendment type and apply changes
-            full_statute_text = statute.full_text
-            amendment_type = AmendmentType.UNKNOWN
-            amendment_instruction = ""
-            subsection_notation = ""
-            used_subsection = False
-
-            if parse_result.success and parse_result.amendments:
-                # Use the first valid amendment found
-                for parsed in parse_result.amendments:
-                    if parsed.is_valid:
-                        # Map parsed type to model type
-                        amendment_type = _map_amendment_type(parsed.amendment_type)
-                        amendment_instruction = parsed.raw_instruction
-
-                        # Get the target text (subsection or full text)
-                        target_text, subsection_notation, used_subsection = _get_target_text_for_amendment(
-                            full_statute_text,
-                            citation.section,
-                            parsed
-                        )
-
-                        if used_subsection:
-                            logger.info(f"Extracted subsection {subsection_notation} for {citation.canonical_citation}")
-
-                        # Apply the amendment to the target text
-                        amended_text, success = amendment_applier.apply(target_text, parsed)
-
-                        if success:
-                            logger.info(f"Applied {amendment_type.value} amendment for {citation.canonical_citation}")
-                            # Use subsection text for comparison (cleaner diff)
-                            original_text = target_text
-                        else:
-                            logger.warning(f"Could not apply amendment for {citation.canonical_citation}")
-                            # Fall back to full text
-                            original_text = full_statute_text
-                            amended_text = full_statute_text
-                        break
-                else:
-                    # No valid amendments found
-                    original_text = full_statute_text
-                    amended_text = full_statute_text
-            else:
-                # Fallback to keyword detection
-                amendment_type = _detect_amendment_type(context_text)
-
-                # Still try to extract subsection for better context
-                subsection_notation = _extract_subsection_notation(citation.section)
-                if subsection_notation:
-                    result = subsection_extractor.extract(full_statute_text, subsection_notation)
-                    if result.success and result.extracted_text:
-                        original_text = result.extracted_text
-                        amended_text = result.extracted_text
-                        used_subsection = True
-                    else:
-                        original_text = full_statute_text
-                        amended_text = full_statute_text
-                else:
-                    original_text = full_statute_text
-                    amended_text = full_statute_text
-
-            # Generate diff HTML using diff-match-patch
-            diff_result = diff_generator.generate(original_text, amended_text, max_length=5000)
-
-            # Add subsection context to diff if used
-            subsection_info = f" (subsection {subsection_notation})" if used_subsection else ""
-            diff_html = generate_redline_html(
-                original_text, amended_text,
-                amendment_type=amendment_type.value + subsection_info,
-                max_length=5000
-            )
-
-            # Create comparison record
-            comparison = Comparison(
-                document_id=document.id,
-                citation_id=citation.id,
-                citation_text=citation.canonical_citation,
-                amendment_type=amendment_type,
-                amendment_instruction=amendment_instruction[:500] if amendment_instruction else None,
-                original_text=original_text,
-                amended_text=amended_text,
-                diff_html=diff_html,
-            )
-            db.add(comparison)
-            comparisons_created += 1
-
-        document.status = DocumentStatus.COMPLETED
-        await db.commit()
-
-        logger.info(f"Generated {comparisons_created} comparisons for document {document_id} ({skipped_definitional} definitional references)")
-
-        return {
-            "document_id": document.id,
-            "message": f"Generated {comparisons_created} comparisons ({skipped_definitional} definitional references)",
-            "comparisons_count": comparisons_created,
-            "definitional_references": skipped_definitional
-        }
+    # Existing comparisons are replaced by the background task itself, so
+    # they are kept if generation fails
+    background_tasks.add_task(_run_comparisons, document.id, claimed_at)
 
-    except Exception as e:
-        logger.error(f"Error generating comparisons for document {document_id}: {e}")
-        document.status = DocumentStatus.FAILED
-        document.error_message = str(e)
-        await db.commit()
-
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate comparisons: {str(e)}"
-        )
+    response.status_code = status.HTTP_202_ACCEPTED
+    return {
+        "document_id": document.id,
+        "status": DocumentStatus.PROCESSING,
+        "message": "Comparison generation started",
+    }
 
 
 @router.get("/{document_id}/result", response_model=ComparisonListResponse)
@@ -296,11 +476,9 @@ async def get_comparison_results(
     Get all comparison results for a document.
     """
     result = await db.execute(
-        select(Document)
-        .options(selectinload(Document.comparisons))
-        .where(Document.id == document_id)
+        select(Document.id, Document.filename).where(Document.id == document_id)
     )
-    document = result.scalar_one_or_none()
+    document = result.one_or_none()
 
     if not document:
         raise HTTPException(
@@ -308,19 +486,38 @@ async def get_comparison_results(
             detail="Document not found"
         )
 
-    comparisons = [
-        ComparisonBase(
-            id=c.id,
-            citation_text=c.citation_text,
-            amendment_type=c.amendment_type,
-            original_text=c.original_text,
-            amended_text=c.amended_text,
-            diff_html=c.diff_html,
+    # Read plain columns rather than ORM objects; results can carry hundreds
+    # of long diff_html payloads
+    result = await db.execute(
+        select(
+            Comparison.id,
+            Comparison.citation_text,
+            Comparison.amendment_type,
+            Comparison.original_text,
+            Comparison.amended_text,
+            Comparison.diff_html,
         )
-        for c in document.comparisons
-    ]
+        .where(Comparison.document_id == document_id)
+    )
 
-    return ComparisonListResponse(
+    comparisons = []
+    for r in result.mappings():
+        original_text = r["original_text"]
+        # Unchanged text is stored once, as in Comparison.resolved_amended_text
+        amended_text = r["amended_text"]
+        if amended_text is None:
+            amended_text = original_text
+        # Values come straight from typed columns, so skip revalidation
+        comparisons.append(ComparisonBase.model_construct(
+            id=r["id"],
+            citation_text=r["citation_text"],
+            amendment_type=r["amendment_type"],
+            original_text=original_text,
+            amended_text=amended_text,
+            diff_html=r["diff_html"],
+        ))
+
+    return ComparisonListResponse.model_construct(
         document_id=document.id,
         document_filename=document.filename,
         comparisons=comparisons,
@@ -328,39 +525,67 @@ async def get_comparison_results(
     )
 
 
-# Import Statute model for the endpoint
-from app.models import Statute
+# Parsed amendment types mapped onto the types stored on comparisons
+_AMENDMENT_TYPE_MAP = {
+    ParsedAmendmentType.STRIKE_INSERT: AmendmentType.STRIKE_INSERT,
+    ParsedAmendmentType.INSERT_AFTER: AmendmentType.INSERT_AFTER,
+    ParsedAmendmentType.INSERT_BEFORE: AmendmentType.INSERT_AFTER,  # Map to INSERT_AFTER
+    ParsedAmendmentType.READ_AS_FOLLOWS: AmendmentType.READ_AS_FOLLOWS,
+    ParsedAmendmentType.ADD_AT_END: AmendmentType.ADD_AT_END,
+    ParsedAmendmentType.ADD_AT_BEGINNING: AmendmentType.ADD_AT_END,  # Map to ADD_AT_END
+    ParsedAmendmentType.STRIKE: AmendmentType.STRIKE,
+    ParsedAmendmentType.REDESIGNATE: AmendmentType.STRIKE_INSERT,  # Treat as strike/insert
+    ParsedAmendmentType.UNKNOWN: AmendmentType.UNKNOWN,
+}
 
 
 def _map_amendment_type(parsed_type: ParsedAmendmentType) -> AmendmentType:
     """Map parsed amendment type to model amendment type."""
-    mapping = {
-        ParsedAmendmentType.STRIKE_INSERT: AmendmentType.STRIKE_INSERT,
-        ParsedAmendmentType.INSERT_AFTER: AmendmentType.INSERT_AFTER,
-        ParsedAmendmentType.INSERT_BEFORE: AmendmentType.INSERT_AFTER,  # Map to INSERT_AFTER
-        ParsedAmendmentType.READ_AS_FOLLOWS: AmendmentType.READ_AS_FOLLOWS,
-        ParsedAmendmentType.ADD_AT_END: AmendmentType.ADD_AT_END,
-        ParsedAmendmentType.ADD_AT_BEGINNING: AmendmentType.ADD_AT_END,  # Map to ADD_AT_END
-        ParsedAmendmentType.STRIKE: AmendmentType.STRIKE,
-        ParsedAmendmentType.REDESIGNATE: AmendmentType.STRIKE_INSERT,  # Treat as strike/insert
-        ParsedAmendmentType.UNKNOWN: AmendmentType.UNKNOWN,
-    }
-    return mapping.get(parsed_type, AmendmentType.UNKNOWN)
+    return _AMENDMENT_TYPE_MAP.get(parsed_type, AmendmentType.UNKNOWN)
+
+
+# Fallback keywords, scanned in a single pass. Each named group sets a bit;
+# "inserting after" also counts as "inserting".
+_STRIKING = 1
+_INSERTING = 2
+_INSERTING_AFTER = 4
+_READ_AS_FOLLOWS = 8
+_ADDING_AT_END = 16
+_STRIKE_AND_INSERT = _STRIKING | _INSERTING
+
+_AMENDMENT_KEYWORD_PATTERN = re.compile(
+    r'(?P<striking>striking)'
+    r'|(?P<inserting_after>inserting after)'
+    r'|(?P<inserting>inserting)'
+    r'|(?P<read_as_follows>read as follows)'
+    r'|(?P<adding_at_end>adding at the end)',
+    re.IGNORECASE,
+)
+
+_KEYWORD_BITS = {
+    "striking": _STRIKING,
+    "inserting_after": _INSERTING_AFTER | _INSERTING,
+    "inserting": _INSERTING,
+    "read_as_follows": _READ_AS_FOLLOWS,
+    "adding_at_end": _ADDING_AT_END,
+}
 
 
 def _detect_amendment_type(context: str) -> AmendmentType:
     """Detect the amendment type from surrounding context (fallback)."""
-    context_lower = context.lower()
+    mask = 0
+    for match in _AMENDMENT_KEYWORD_PATTERN.finditer(context):
+        mask |= _KEYWORD_BITS[match.lastgroup]
+        if mask & _STRIKE_AND_INSERT == _STRIKE_AND_INSERT:
+            return AmendmentType.STRIKE_INSERT
 
-    if "striking" in context_lower and "inserting" in context_lower:
-        return AmendmentType.STRIKE_INSERT
-    elif "inserting after" in context_lower:
+    if mask & _INSERTING_AFTER:
         return AmendmentType.INSERT_AFTER
-    elif "read as follows" in context_lower:
+    elif mask & _READ_AS_FOLLOWS:
         return AmendmentType.READ_AS_FOLLOWS
-    elif "adding at the end" in context_lower:
+    elif mask & _ADDING_AT_END:
         return AmendmentType.ADD_AT_END
-    elif "striking" in context_lower:
+    elif mask & _STRIKING:
         return AmendmentType.STRIKE
     else:
         return AmendmentType.UNKNOWN
@@ -4,31 +4,62 @@ Document API endpoints
 Handles document upload, parsing, and citation detection.
 """
 
+import asyncio
 import logging
-import shutil
 from pathlib import Path
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional, Tuple
 
+import anyio
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import func, select
+from sqlalchemy.orm import raiseload
 
+from app.db.bulk import bulk_insert
 from app.db.session import get_db
+from app.db.uuid7 import uuid7
 from app.core.config import settings
-from app.models import Document, DocumentStatus, Citation, CitationType
+from app.models import Document, DocumentStatus, Citation, CitationType, Comparison
+from app.models.citation import extract_subsection_notation
 from app.schemas import (
     DocumentUploadResponse,
     DocumentParseResponse,
     CitationListResponse,
-    CitationBase,
 )
-from app.services import DocumentParser, CitationDetector
+from app.services import DocumentParser, CitationDetector, DetectedCitation, ParsedDocument
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/documents", tags=["documents"])
 
+# Bytes read from an upload per write
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Raw bytes of recent uploads by document id, bounded by total size, so the
+# usual upload-then-parse flow doesn't read the file back from disk. Only
+# touched from the event loop, so no lock is needed.
+_upload_cache: TTLCache = TTLCache(
+    maxsize=settings.UPLOAD_MEMORY_CACHE_MB * 1024 * 1024,
+    ttl=settings.UPLOAD_MEMORY_CACHE_SECONDS,
+    getsizeof=len,
+)
+
+# Detector output carries plain strings; map them without the Enum call per row
+_CITATION_TYPE_BY_VALUE = {e.value: e for e in CitationType}
+
+# Columns returned by get_document_citations, matching CitationBase
+_CITATION_LIST_COLUMNS = (
+    Citation.id,
+    Citation.citation_type,
+    Citation.title,
+    Citation.section,
+    Citation.subsection,
+    Citation.raw_text,
+    Citation.statute_fetched,
+)
+
 # Initialize services
 document_parser = DocumentParser()
 citation_detector = CitationDetector()
@@ -58,62 +89,95 @@ async def upload_document(
             detail=f"Unsupported file type. Supported: PDF, DOCX"
         )
 
-    # Check file size
+    # Reject early when the multipart parser already knows the size
     max_size = settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset
-
-    if file_size > max_size:
+    too_large_detail = f"File too large. Maximum size: {settings.MAX_UPLOAD_SIZE_MB}MB"
+    if file.size is not None and file.size > max_size:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File too large. Maximum size: {settings.MAX_UPLOAD_SIZE_MB}MB"
+            detail=too_large_detail
         )
 
-    # Create document record
+    # Build the document record up front so its id names the file; it is
+    # only inserted once the file is safely on disk
     file_type = document_parser.get_file_type(file.filename)
     document = Document(
+        id=uuid7(),
         filename=file.filename,
         file_type=file_type,
         status=DocumentStatus.UPLOADED,
     )
 
-    db.add(document)
-    await db.commit()
-    await db.refresh(document)
-
     # Save file to disk
     upload_dir = Path(settings.UPLOAD_DIR)
     upload_dir.mkdir(parents=True, exist_ok=True)
 
     file_path = upload_dir / f"{document.id}.{file_type}"
+    part_path = file_path.with_name(file_path.name + ".part")
 
+    # Stream in chunks without blocking the event loop, stopping as soon
+    # as the size limit is exceeded
+    written = 0
+    chunks = []
     try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-
-        # Update document with file path
-        document.file_path = str(file_path)
-        await db.commit()
-
-        logger.info(f"Document uploaded: {document.id} - {file.filename}")
-
-        return DocumentUploadResponse(
-            id=document.id,
-            filename=document.filename,
-            file_type=document.file_type,
-            status=document.status,
-            created_at=document.created_at,
-        )
-
+        async with await anyio.open_file(part_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > max_size:
+                    break
+                await buffer.write(chunk)
+                if written <= _upload_cache.maxsize:
+                    chunks.append(chunk)
     except Exception as e:
         logger.error(f"Error saving file: {e}")
-        await db.rollback()
+        part_path.unlink(missing_ok=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to save uploaded file"
         )
 
+    if written > max_size:
+        part_path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=too_large_detail
+        )
+
+    part_path.replace(file_path)
+
+    # created_at/expires_at are generated by the database and read back from
+    # the INSERT's RETURNING clause (eager_defaults), and the session keeps
+    # attributes after commit (expire_on_commit=False), so no refresh is needed
+    document.file_path = str(file_path)
+    db.add(document)
+    await db.commit()
+
+    if written <= _upload_cache.maxsize:
+        _upload_cache[document.id] = b"".join(chunks)
+
+    logger.info(f"Document uploaded: {document.id} - {file.filename}")
+
+    return DocumentUploadResponse(
+        id=document.id,
+        filename=document.filename,
+        file_type=document.file_type,
+        status=document.status,
+        created_at=document.created_at,
+    )
+
+
+def _parse_and_detect(
+    file_path: str,
+    file_type: str,
+    data: Optional[bytes] = None
+) -> Tuple[ParsedDocument, List[DetectedCitation]]:
+    """Extract a document's text and detect the citations in it."""
+    if data is not None:
+        parsed = document_parser.parse_bytes(data, file_type, name=file_path)
+    else:
+        parsed = document_parser.parse(file_path)
+    return parsed, citation_detector.detect_all(parsed.raw_text)
+
 
 @router.post("/{document_id}/parse", response_model=DocumentParseResponse)
 async def parse_document(
@@ -144,34 +208,37 @@ async def parse_document(
             detail="Document file not found"
         )
 
-    # Update status
-    document.status = DocumentStatus.PARSING
-    await db.commit()
-
+    # The parse runs within this request, so nobody can observe an
+    # intermediate PARSING status; the outcome is written in one commit
     try:
-        # Parse document
-        parsed = document_parser.parse(document.file_path)
+        # Parsing and detection are CPU-bound, so run them in a worker
+        # thread to keep the event loop free
+        parsed, detected = await asyncio.to_thread(
+            _parse_and_detect,
+            document.file_path,
+            document.file_type,
+            _upload_cache.pop(document.id, None),
+        )
         document.raw_text = parsed.raw_text
 
-        # Detect citations
-        detected = citation_detector.detect_all(parsed.raw_text)
-
-        # Create citation records
-        citations_count = 0
-        for detected_citation in detected:
-            citation = Citation(
+        # Insert all citation records in one batch
+        citation_rows = [
+            dict(
                 document_id=document.id,
-                citation_type=CitationType(detected_citation.citation_type),
+                citation_type=_CITATION_TYPE_BY_VALUE[detected_citation.citation_type],
                 title=detected_citation.title,
                 section=detected_citation.section,
                 subsection=detected_citation.subsection,
+                subsection_notation=extract_subsection_notation(detected_citation.section),
                 raw_text=detected_citation.raw_text,
                 position_start=detected_citation.start_pos,
                 position_end=detected_citation.end_pos,
                 context_text=detected_citation.context_text,
             )
-            db.add(citation)
-            citations_count += 1
+            for detected_citation in detected
+        ]
+        await bulk_insert(db, Citation, citation_rows)
+        citations_count = len(citation_rows)
 
         document.status = DocumentStatus.PARSED
         await db.commit()
@@ -187,6 +254,8 @@ async def parse_document(
 
     except Exception as e:
         logger.error(f"Error parsing document {document_id}: {e}")
+        # Discard any partially inserted citations before recording the failure
+        await db.rollback()
         document.status = DocumentStatus.FAILED
         document.error_message = str(e)
         await db.commit()
@@ -197,46 +266,41 @@ async def parse_document(
         )
 
 
-@router.get("/{document_id}/citations", response_model=CitationListResponse)
+@router.get(
+    "/{document_id}/citations",
+    response_class=ORJSONResponse,
+    responses={200: {"model": CitationListResponse}},
+)
 async def get_document_citations(
     document_id: UUID,
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get all citations detected in a document.
+
+    Rows are read as plain column mappings and serialized straight to
+    JSON, skipping ORM objects and per-row Pydantic models.
     """
-    # Get document with citations
-    result = await db.execute(
-        select(Document)
-        .options(selectinload(Document.citations))
-        .where(Document.id == document_id)
+    document_exists = await db.scalar(
+        select(Document.id).where(Document.id == document_id)
     )
-    document = result.scalar_one_or_none()
 
-    if not document:
+    if not document_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Document not found"
         )
 
-    citations = [
-        CitationBase(
-            id=c.id,
-            citation_type=c.citation_type,
-            title=c.title,
-            section=c.section,
-            subsection=c.subsection,
-            raw_text=c.raw_text,
-            statute_fetched=c.statute_fetched,
-        )
-        for c in document.citations
-    ]
-
-    return CitationListResponse(
-        document_id=document.id,
-        citations=citations,
-        total=len(citations)
+    result = await db.execute(
+        select(*_CITATION_LIST_COLUMNS).where(Citation.document_id == document_id)
     )
+    citations = [dict(row) for row in result.mappings()]
+
+    return ORJSONResponse({
+        "document_id": document_id,
+        "citations": citations,
+        "total": len(citations),
+    })
 
 
 @router.get("/{document_id}")
@@ -247,20 +311,34 @@ async def get_document(
     """
     Get document details.
     """
+    # Count related rows in the database instead of loading them
+    citations_count = (
+        select(func.count())
+        .select_from(Citation)
+        .where(Citation.document_id == Document.id)
+        .scalar_subquery()
+    )
+    comparisons_count = (
+        select(func.count())
+        .select_from(Comparison)
+        .where(Comparison.document_id == Document.id)
+        .scalar_subquery()
+    )
     result = await db.execute(
-        select(Document)
-        .options(selectinload(Document.citations))
-        .options(selectinload(Document.comparisons))
+        select(Document, citations_count, comparisons_count)
+        .options(raiseload('*'))
         .where(Document.id == document_id)
     )
-    document = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not document:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Document not found"
         )
 
+    document, citations_count, comparisons_count = row
+
     return {
         "id": document.id,
         "filename": document.filename,
@@ -268,7 +346,7 @@ async def get_document(
         "status": document.status,
         "created_at": document.created_at,
         "expires_at": document.expires_at,
-        "citations_count": len(document.citations),
-        "comparisons_count": len(document.comparisons),
+        "citations_count": citations_count,
+        "comparisons_count": comparisons_count,
         "error_message": document.error_message,
     }
@@ -1,30 +1,62 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import logging
+from datetime import datetime
+from typing import Tuple
+
+from fastapi import APIRouter, FastAPI, Request
 from sqlalchemy import text
 
-from app.db.session import get_db
+from app.db.session import engine
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Seconds between background database probes
+HEALTH_CHECK_INTERVAL = 5.0
 
-@router.get("/health")
-async def health_check(db: AsyncSession = Depends(get_db)):
-    """
-    Health check endpoint.
 
-    Returns the service status and database connectivity.
-    """
-    # Check database connectivity
+async def check_database() -> Tuple[datetime, str]:
+    """Probe the database once and return (checked_at, status)."""
     db_status = "healthy"
     try:
-        await db.execute(text("SELECT 1"))
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
     except Exception as e:
         db_status = f"unhealthy: {str(e)}"
+    return datetime.utcnow(), db_status
+
+
+async def monitor_database(app: FastAPI) -> None:
+    """
+    Refresh app.state.db_health every HEALTH_CHECK_INTERVAL seconds.
+
+    Health probes read the stored result, so frequent load-balancer
+    checks don't each take a pooled connection.
+    """
+    while True:
+        app.state.db_health = await check_database()
+        await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+
+
+@router.get("/health")
+async def health_check(request: Request):
+    """
+    Health check endpoint.
+
+    Returns the service status and database connectivity, as of the most
+    recent background probe.
+    """
+    db_health = getattr(request.app.state, "db_health", None)
+    if db_health is None:
+        # Monitor hasn't reported yet
+        db_health = await check_database()
+    checked_at, db_status = db_health
 
     return {
         "status": "healthy" if db_status == "healthy" else "degraded",
         "version": settings.VERSION,
         "database": db_status,
+        "database_checked_at": checked_at,
         "govinfo_configured": bool(settings.GOVINFO_API_KEY),
     }
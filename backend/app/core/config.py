@@ -1,6 +1,8 @@
+from functools import cached_property, lru_cache
+
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
-from typing import List, Union
+from typing import List, Literal, Union
 
 
 class Settings(BaseSettings):
@@ -12,7 +14,12 @@ class Settings(BaseSettings):
     # Application-specific settings
     DOCUMENT_RETENTION_HOURS: int = 24
     STATUTE_CACHE_DAYS: int = 7
+    STATUTE_MEMORY_CACHE_SECONDS: int = 3600  # In-process cache of fetched statutes
+    STATUTE_MEMORY_CACHE_SIZE: int = 1024
     MAX_UPLOAD_SIZE_MB: int = 50
+    UPLOAD_MEMORY_CACHE_MB: int = 128  # Recent uploads kept in memory for parsing
+    UPLOAD_MEMORY_CACHE_SECONDS: int = 600
+    COMPARISON_TIMEOUT_MINUTES: int = 10  # After this a processing run may be reclaimed
 
     # CORS
     BACKEND_CORS_ORIGINS: Union[List[str], str] = [
@@ -39,11 +46,12 @@ class Settings(BaseSettings):
     POSTGRES_PORT: str = "5432"
     POSTGRES_DB: str = "redline_db"
 
-    @property
+    # Connection URLs are built once on first use
+    @cached_property
     def DATABASE_URL(self) -> str:
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
-    @property
+    @cached_property
     def DATABASE_URL_SYNC(self) -> str:
         """Sync URL for Alembic migrations"""
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
@@ -54,12 +62,19 @@ class Settings(BaseSettings):
     # Security
     SECRET_KEY: str = "dev-secret-key-change-in-production"
 
-    # Upload directory
+    # Upload directory; "tmpfs" declares it RAM-backed, which is checked at startup
     UPLOAD_DIR: str = "/app/uploads"
+    UPLOAD_FS: Literal["disk", "tmpfs"] = "disk"
 
     class Config:
         env_file = ".env"
         case_sensitive = True
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment only once."""
+    return Settings()
+
+
+settings = get_settings()
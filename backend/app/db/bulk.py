@@ -0,0 +1,83 @@
+"""
+Bulk insert helpers.
+
+Inserts many rows in one round trip instead of one INSERT per ORM object.
+Small batches use an executemany INSERT; large batches switch to
+PostgreSQL COPY through the underlying asyncpg connection.
+"""
+
+import enum
+from typing import Any, Dict, List, Type
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import Base
+
+# Row count above which COPY beats a multi-row INSERT
+COPY_THRESHOLD = 100
+
+
+def _fill_defaults(model: Type[Base], rows: List[Dict[str, Any]]) -> List[str]:
+    """
+    Apply Python-side column defaults to rows in place.
+
+    COPY bypasses SQLAlchemy, so Python-side defaults declared on the model
+    must be materialized before the rows are sent. Server defaults are left
+    to PostgreSQL, which applies them to columns missing from the COPY.
+
+    Returns:
+        Column names present in the rows, in table order
+    """
+    table = model.__table__
+    for column in table.columns:
+        default = column.default
+        if default is None:
+            continue
+        for row in rows:
+            if column.key not in row:
+                row[column.key] = default.arg(None) if default.is_callable else default.arg
+
+    present = set().union(*rows)
+    return [column.key for column in table.columns if column.key in present]
+
+
+def _to_db_value(value: Any) -> Any:
+    """Convert Python enums to the string values stored in PostgreSQL."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+async def bulk_insert(
+    session: AsyncSession,
+    model: Type[Base],
+    rows: List[Dict[str, Any]],
+    copy_threshold: int = COPY_THRESHOLD,
+) -> None:
+    """
+    Insert rows for a model within the session's current transaction.
+
+    Args:
+        session: Active database session
+        model: Mapped model class to insert into
+        rows: Column-name to value mappings, one per row
+        copy_threshold: Use COPY when there are more rows than this
+    """
+    if not rows:
+        return
+
+    if len(rows) <= copy_threshold:
+        await session.execute(insert(model), rows)
+        return
+
+    columns = _fill_defaults(model, rows)
+    records = [tuple(_to_db_value(row.get(column)) for column in columns) for row in rows]
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        model.__tablename__,
+        records=records,
+        columns=columns,
+    )
@@ -7,6 +7,20 @@ engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
     future=True,
+    # Test pooled connections on checkout so dropped ones are replaced
+    # transparently instead of failing a request
+    pool_pre_ping=True,
+    connect_args={
+        # Keep more prepared statements per connection so hot queries skip
+        # the PARSE/DESCRIBE round trip (asyncpg and SQLAlchemy default to 100)
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 1024,
+        "server_settings": {
+            # Our queries are short point lookups; JIT compilation only adds latency
+            "jit": "off",
+            "application_name": "redline",
+        },
+    },
 )
 
 async_session_maker = async_sessionmaker(
@@ -1,13 +1,39 @@
+import asyncio
+import contextlib
+import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
+from app.db.session import engine
 from app.api.v1 import health
 from app.api.v1 import documents, citations, comparisons
 
+logger = logging.getLogger(__name__)
+
+
+def _filesystem_type(path: Path) -> str:
+    """Return the type of the filesystem mounted at path, or "unknown"."""
+    path = path.resolve()
+    best_mount, best_type = "", "unknown"
+    try:
+        with open("/proc/mounts") as mounts:
+            for line in mounts:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount_point, fs_type = fields[1], fields[2]
+                if path.is_relative_to(mount_point) and len(mount_point) > len(best_mount):
+                    best_mount, best_type = mount_point, fs_type
+    except OSError:
+        pass
+    return best_type
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -15,9 +41,23 @@ async def lifespan(app: FastAPI):
     # Startup: ensure upload directory exists
     upload_dir = Path(settings.UPLOAD_DIR)
     upload_dir.mkdir(parents=True, exist_ok=True)
+    upload_fs = _filesystem_type(upload_dir)
+    logger.info(f"Upload directory {upload_dir} is on {upload_fs}")
+    if settings.UPLOAD_FS == "tmpfs" and upload_fs != "tmpfs":
+        logger.warning(f"UPLOAD_FS is tmpfs but {upload_dir} is on {upload_fs}; uploads will hit disk")
+    # Exercise the parser and detector once, off the event loop
+    await asyncio.to_thread(documents.document_parser.warmup)
+    await asyncio.to_thread(documents.citation_detector.warmup)
+    # Keep a cached database health result for /health
+    health_monitor = asyncio.create_task(health.monitor_database(app))
     yield
-    # Shutdown
-    pass
+    # Shutdown: stop the health probe before the resources it uses go away
+    health_monitor.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await health_monitor
+    # Release pooled connections to govinfo.gov / eCFR.gov and the database
+    await citations.statute_fetcher.aclose()
+    await engine.dispose()
 
 
 app = FastAPI(
@@ -46,6 +86,7 @@ app = FastAPI(
     docs_url=f"{settings.API_V1_STR}/docs",
     redoc_url=f"{settings.API_V1_STR}/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -57,10 +98,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses; redline HTML is long and highly repetitive
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Include routers
 app.include_router(health.router, prefix=settings.API_V1_STR, tags=["health"])
 app.include_router(documents.router, prefix=settings.API_V1_STR)
 app.include_router(citations.router, prefix=settings.API_V1_STR)
+app.include_router(citations.document_router, prefix=settings.API_V1_STR)
 app.include_router(comparisons.router, prefix=settings.API_V1_STR)
 
 
@@ -1,9 +1,10 @@
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Text, DateTime, Boolean, ForeignKey, Enum as SQLEnum
+from typing import Optional
+from sqlalchemy import Column, String, Integer, Text, DateTime, Boolean, ForeignKey, Index, Enum as SQLEnum, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
+import re
 
 from app.db.session import Base
 
@@ -14,16 +15,58 @@ class CitationType(str, enum.Enum):
     PUBLAW = "publaw"
 
 
+def format_canonical_citation(
+    citation_type: CitationType,
+    title: Optional[int],
+    section: str,
+    subsection: Optional[str],
+    raw_text: str,
+) -> str:
+    """Return a standardized citation format from citation fields."""
+    if citation_type == CitationType.USC:
+        base = f"{title} U.S.C. § {section}"
+        if subsection:
+            base += f"({subsection})"
+        return base
+    elif citation_type == CitationType.CFR:
+        return f"{title} C.F.R. § {section}"
+    elif citation_type == CitationType.PUBLAW:
+        return f"Pub. L. {title}-{section}"
+    return raw_text
+
+
+# Run of parenthetical parts in a section, e.g. "(b)(1)" in "1922(b)(1)"
+SUBSECTION_NOTATION_PATTERN = re.compile(r'(\([^)]+\))+')
+
+
+def extract_subsection_notation(section: str) -> Optional[str]:
+    """
+    Extract subsection notation from a section string.
+
+    Examples:
+        "1922(b)(1)" -> "(b)(1)"
+        "1923(a)" -> "(a)"
+        "501" -> None
+    """
+    match = SUBSECTION_NOTATION_PATTERN.search(section)
+    if match:
+        return match.group(0)
+    return None
+
+
 class Citation(Base):
     __tablename__ = "citations"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Assigned by uuid_generate_v7() (migration 003); rows are only ever bulk
+    # inserted, so leaving the id to the database skips generating it per row
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v7()"))
     document_id = Column(UUID(as_uuid=True), ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
 
     citation_type = Column(SQLEnum(CitationType, values_callable=lambda x: [e.value for e in x]), nullable=False)
     title = Column(Integer, nullable=True)  # e.g., 26 for "26 USC"
     section = Column(String(50), nullable=False)  # e.g., "501" or "482.12"
     subsection = Column(String(100), nullable=True)  # e.g., "(c)(3)"
+    subsection_notation = Column(String(100), nullable=True)  # From section, e.g. "(b)(1)"
     raw_text = Column(String(255), nullable=False)  # Original text found in document
 
     # Position in document
@@ -39,10 +82,17 @@ class Citation(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow)
 
-    # Relationships
+    # Document lookups and statute joins (migrations 001 and 002)
+    __table_args__ = (
+        Index('ix_citations_document_id', 'document_id'),
+        Index('ix_citations_statute_id', 'statute_id'),
+    )
+
+    # Relationships; statute and comparison must be loaded explicitly with
+    # selectinload so listing citations never fans out into per-row queries
     document = relationship("Document", back_populates="citations")
-    statute = relationship("Statute", back_populates="citations")
-    comparison = relationship("Comparison", back_populates="citation", uselist=False)
+    statute = relationship("Statute", back_populates="citations", lazy="raise_on_sql")
+    comparison = relationship("Comparison", back_populates="citation", uselist=False, lazy="raise_on_sql")
 
     def __repr__(self):
         return f"<Citation {self.raw_text}>"
@@ -50,13 +100,6 @@ class Citation(Base):
     @property
     def canonical_citation(self) -> str:
         """Return a standardized citation format."""
-        if self.citation_type == CitationType.USC:
-            base = f"{self.title} U.S.C. § {self.section}"
-            if self.subsection:
-                base += f"({self.subsection})"
-            return base
-        elif self.citation_type == CitationType.CFR:
-            return f"{self.title} C.F.R. § {self.section}"
-        elif self.citation_type == CitationType.PUBLAW:
-            return f"Pub. L. {self.title}-{self.section}"
-        return self.raw_text
+        return format_canonical_citation(
+            self.citation_type, self.title, self.section, self.subsection, self.raw_text
+        )
@@ -1,6 +1,6 @@
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum as SQLEnum
+from typing import Optional
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index, Enum as SQLEnum, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
@@ -20,9 +20,12 @@ class AmendmentType(str, enum.Enum):
 class Comparison(Base):
     __tablename__ = "comparisons"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Assigned by uuid_generate_v7() (migration 003); rows are only ever bulk
+    # inserted, so leaving the id to the database skips generating it per row
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v7()"))
     document_id = Column(UUID(as_uuid=True), ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
     citation_id = Column(UUID(as_uuid=True), ForeignKey("citations.id"), nullable=True)
+    statute_id = Column(UUID(as_uuid=True), ForeignKey("statutes.id"), nullable=True)
 
     # Citation text for display
     citation_text = Column(String(255), nullable=True)
@@ -31,7 +34,9 @@ class Comparison(Base):
     amendment_type = Column(SQLEnum(AmendmentType, values_callable=lambda x: [e.value for e in x]), nullable=True)
     amendment_instruction = Column(Text, nullable=True)  # Raw amendment language
 
-    # Text comparison
+    # Text comparison. amended_text is NULL when it equals the original.
+    # original_text is always stored: statutes are refreshed in place, so
+    # the statute row can't stand in for the text the diff was built from.
     original_text = Column(Text, nullable=True)
     amended_text = Column(Text, nullable=True)
 
@@ -40,9 +45,24 @@ class Comparison(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # Mirrors the indexes created in migrations 001, 002 and 004
+    __table_args__ = (
+        Index('ix_comparisons_document_id', 'document_id'),
+        Index('ix_comparisons_citation_id', 'citation_id'),
+        Index('ix_comparisons_statute_id', 'statute_id'),
+    )
+
     # Relationships
     document = relationship("Document", back_populates="comparisons")
     citation = relationship("Citation", back_populates="comparison")
+    statute = relationship("Statute")
 
     def __repr__(self):
         return f"<Comparison {self.citation_text} ({self.amendment_type})>"
+
+    @property
+    def resolved_amended_text(self) -> Optional[str]:
+        """Amended text, falling back to the original when unchanged."""
+        if self.amended_text is not None:
+            return self.amended_text
+        return self.original_text
@@ -1,11 +1,13 @@
-import uuid
-from datetime import datetime, timedelta
-from sqlalchemy import Column, String, Text, DateTime, Enum as SQLEnum
+from datetime import timedelta
+
+from sqlalchemy import Column, String, Text, DateTime, Enum as SQLEnum, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
 
+from app.core.config import settings
 from app.db.session import Base
+from app.db.uuid7 import uuid7
 
 
 class DocumentStatus(str, enum.Enum):
@@ -20,7 +22,7 @@ class DocumentStatus(str, enum.Enum):
 class Document(Base):
     __tablename__ = "documents"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     filename = Column(String(255), nullable=False)
     file_type = Column(String(10), nullable=False)  # pdf, docx, gdoc
     file_path = Column(String(500), nullable=True)  # Path to stored file
@@ -31,15 +33,30 @@ class Document(Base):
         nullable=False
     )
     error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # When the current comparison run claimed the document; identifies the
+    # run that owns the processing state and lets a lost run be reclaimed
+    processing_started_at = Column(DateTime, nullable=True)
+    # Timestamps are naive UTC from the database clock. The retention period
+    # is bound into each INSERT rather than the column DDL, so a changed
+    # DOCUMENT_RETENTION_HOURS applies to new rows without a migration
+    created_at = Column(DateTime, server_default=text("timezone('utc', now())"))
     expires_at = Column(
         DateTime,
-        default=lambda: datetime.utcnow() + timedelta(hours=24)
+        default=func.timezone('utc', func.now(), type_=DateTime)
+        + timedelta(hours=settings.DOCUMENT_RETENTION_HOURS)
+    )
+
+    # Relationships; collections must be loaded explicitly (e.g. selectinload)
+    # since a lazy load under asyncio would fail or issue hidden queries
+    citations = relationship(
+        "Citation", back_populates="document", cascade="all, delete-orphan", lazy="raise_on_sql"
+    )
+    comparisons = relationship(
+        "Comparison", back_populates="document", cascade="all, delete-orphan", lazy="raise_on_sql"
     )
 
-    # Relationships
-    citations = relationship("Citation", back_populates="document", cascade="all, delete-orphan")
-    comparisons = relationship("Comparison", back_populates="document", cascade="all, delete-orphan")
+    # Read server-generated timestamps back in the INSERT's RETURNING clause
+    __mapper_args__ = {"eager_defaults": True}
 
     def __repr__(self):
         return f"<Document {self.filename} ({self.status})>"
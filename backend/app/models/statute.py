@@ -1,11 +1,12 @@
-import uuid
-from datetime import datetime, timedelta
-from sqlalchemy import Column, String, Integer, Text, DateTime, UniqueConstraint, Enum as SQLEnum
+from datetime import timedelta
+from sqlalchemy import Column, String, Integer, Text, DateTime, Index, UniqueConstraint, Enum as SQLEnum, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
 
+from app.core.config import settings
 from app.db.session import Base
+from app.db.uuid7 import uuid7
 
 
 class StatuteSource(str, enum.Enum):
@@ -17,7 +18,7 @@ class StatuteSource(str, enum.Enum):
 class Statute(Base):
     __tablename__ = "statutes"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Citation identification
     citation_type = Column(String(10), nullable=False)  # usc, cfr
@@ -33,25 +34,31 @@ class Statute(Base):
     source_url = Column(String(500), nullable=True)
     effective_date = Column(DateTime, nullable=True)
 
-    # Cache management
-    fetched_at = Column(DateTime, default=datetime.utcnow)
+    # Cache management; the cache period is bound into each INSERT so a
+    # changed STATUTE_CACHE_DAYS applies without a migration
+    fetched_at = Column(DateTime, server_default=text("timezone('utc', now())"))
     expires_at = Column(
         DateTime,
-        default=lambda: datetime.utcnow() + timedelta(days=7)
+        default=func.timezone('utc', func.now(), type_=DateTime)
+        + timedelta(days=settings.STATUTE_CACHE_DAYS)
     )
 
     # Relationships
     citations = relationship("Citation", back_populates="statute")
 
-    # Unique constraint on citation type + title + section
+    # Unique constraint on citation type + title + section; the lookup index
+    # adds expiry and id so cache checks are answered from the index alone
     __table_args__ = (
         UniqueConstraint('citation_type', 'title', 'section', name='uq_statute_citation'),
+        Index(
+            'ix_statute_lookup',
+            'citation_type', 'title', 'section', 'expires_at',
+            postgresql_include=['id'],
+        ),
     )
 
+    # Fetch times are part of cache keys, so load them right after INSERT
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
         return f"<Statute {self.citation_type} {self.title} § {self.section}>"
-
-    @property
-    def is_expired(self) -> bool:
-        """Check if the cached statute has expired."""
-        return datetime.utcnow() > self.expires_at
@@ -10,6 +10,7 @@ from app.schemas.citation import (
     CitationDetail,
     CitationListResponse,
     CitationFetchResponse,
+    DocumentStatuteFetchResponse,
 )
 from app.schemas.comparison import (
     ComparisonBase,
@@ -27,6 +28,7 @@ __all__ = [
     "CitationDetail",
     "CitationListResponse",
     "CitationFetchResponse",
+    "DocumentStatuteFetchResponse",
     "ComparisonBase",
     "ComparisonDetail",
     "ComparisonListResponse",
@@ -41,3 +41,12 @@ class CitationFetchResponse(BaseModel):
     statute_fetched: bool
     statute_heading: Optional[str] = None
     message: str
+
+
+class DocumentStatuteFetchResponse(BaseModel):
+    """Response after fetching statutes for every citation in a document."""
+    document_id: UUID
+    total: int
+    fetched: int
+    failed: int
+    results: List[CitationFetchResponse]
@@ -13,11 +13,13 @@ from app.services.amendment_parser import (
     ParsedAmendment,
     AmendmentParseResult,
     AmendmentType,
+    ContextClassification,
 )
 from app.services.diff_generator import (
     DiffGenerator,
     DiffResult,
     generate_redline_html,
+    generate_unchanged_html,
 )
 from app.services.subsection_extractor import (
     SubsectionExtractor,
@@ -41,9 +43,11 @@ __all__ = [
     "ParsedAmendment",
     "AmendmentParseResult",
     "AmendmentType",
+    "ContextClassification",
     "DiffGenerator",
     "DiffResult",
     "generate_redline_html",
+    "generate_unchanged_html",
     "SubsectionExtractor",
     "ExtractionResult",
     "SubsectionMatch",
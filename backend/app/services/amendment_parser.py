@@ -16,9 +16,11 @@ Common amendment patterns in legislative text:
 Reference: Senate Legislative Drafting Manual, House Rules (Ramseyer rule)
 """
 
+import functools
 import re
 import logging
-from dataclasses import dataclass, field
+import dataclasses
+from dataclasses import dataclass
 from typing import List, Optional, Tuple
 from enum import Enum
 
@@ -39,7 +41,7 @@ class AmendmentType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedAmendment:
     """A parsed amendment instruction."""
     amendment_type: AmendmentType
@@ -76,15 +78,33 @@ class ParsedAmendment:
         return False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AmendmentParseResult:
     """Result of parsing amendment text."""
-    amendments: List[ParsedAmendment] = field(default_factory=list)
+    amendments: Tuple[ParsedAmendment, ...] = ()
     unparsed_text: str = ""
     success: bool = False
     error_message: Optional[str] = None
 
 
+@dataclass(frozen=True, slots=True)
+class ContextClassification:
+    """Definitional/amendment flags and parse output for one context."""
+    is_definitional: bool = False
+    is_amendment: bool = False
+    parse_result: Optional[AmendmentParseResult] = None  # None when definitional
+
+
+# Punctuation named in instructions like "striking the period at the end"
+_WORD_TO_CHAR = {"period": ".", "comma": ",", "semicolon": ";", "colon": ":"}
+
+
+@functools.lru_cache(maxsize=1024)
+def _ci_pattern(literal: str) -> re.Pattern:
+    """Compile a case-insensitive pattern matching literal text."""
+    return re.compile(re.escape(literal), re.IGNORECASE)
+
+
 class AmendmentParser:
     """
     Parses legislative amendment instructions from context text.
@@ -96,8 +116,19 @@ class AmendmentParser:
             print(f"Type: {amendment.amendment_type}")
             print(f"Strike: {amendment.text_to_strike}")
             print(f"Insert: {amendment.text_to_insert}")
+
+    Parse results are cached per instance by text and shared between
+    calls, so they are frozen and hold their amendments in a tuple.
     """
 
+    # Distinct texts whose parse results are kept per parser
+    PARSE_CACHE_SIZE = 1024
+
+    def __init__(self):
+        self._parse_normalized = functools.lru_cache(maxsize=self.PARSE_CACHE_SIZE)(
+            self._parse_normalized
+        )
+
     # Quote normalization mappings (smart quotes -> straight quotes)
     QUOTE_NORMALIZATION = {
         '\u201c': '"',  # Left double quotation mark
@@ -133,8 +164,23 @@ class AmendmentParser:
     # Patterns for different amendment types
     # Using non-greedy matching and flexible quote handling
 
-    # Pattern for quoted text - handles single quotes, double quotes, and smart quotes
-    QUOTE_PATTERN = r'["\u201c\u201d\u2018\u2019\']([^"\u201c\u201d\u2018\u2019\']+)["\u201c\u201d\u2018\u2019\']'
+    # Pattern for quoted text - handles single quotes, double quotes, and smart quotes.
+    # The body is possessive: a shorter run could never be followed by a
+    # closing quote, so giving characters back on failure is wasted work.
+    QUOTE_PATTERN = r'["\u201c\u201d\u2018\u2019\']([^"\u201c\u201d\u2018\u2019\']++)["\u201c\u201d\u2018\u2019\']'
+
+    # Characters QUOTE_PATTERN accepts as quotes
+    QUOTE_CHARS = '"\u201c\u201d\u2018\u2019\''
+
+    # Text up to the next blank line or the end, at least one character.
+    # Same result as (.+?)(?=\n\n|\Z) under DOTALL, but consumed in runs
+    # instead of testing the lookahead at every character. Nothing follows it
+    # in any pattern, so its runs are possessive.
+    BLOCK_TEXT = r'(.[^\n]*+(?:\n(?!\n)[^\n]*+)*+)'
+
+    # Text up to the next closing double quote or the end, at least one
+    # character; the unrolled form of (.+?)(?:["\u201d]|\Z) under DOTALL
+    QUOTED_BLOCK_TEXT = r'(.[^"\u201d]*+)(?:["\u201d]|\Z)'
 
     # Alternative: text between quotes or after colon until period/semicolon
     TEXT_AFTER_COLON = r':\s*["\u201c]?([^"\u201d;.]+)["\u201d]?'
@@ -170,7 +216,7 @@ class AmendmentParser:
         # Captures full "paragraph (X)" as group 1, insert text as group 2
         # Handles truncated context where closing quote may be missing
         re.compile(
-            r'(?:by\s+)?striking\s+(paragraph\s*\(\d+\))\s+and\s+inserting\s+the\s+following:\s*\n+["\u201c](.+?)(?:["\u201d]|\Z)',
+            r'(?:by\s+)?striking\s+(paragraph\s*\(\d+\))\s+and\s+inserting\s+the\s+following:\s*\n+["\u201c]' + QUOTED_BLOCK_TEXT,
             re.IGNORECASE | re.DOTALL
         ),
         # "by striking paragraph (X) and inserting 'Y'" (inline)
@@ -246,12 +292,12 @@ class AmendmentParser:
     READ_AS_FOLLOWS_PATTERNS = [
         # "is amended to read as follows:"
         re.compile(
-            r'(?:is\s+)?amended\s+to\s+read\s+as\s+follows[:\s]+(.+?)(?=\n\n|\Z)',
+            r'(?:is\s+)?amended\s+to\s+read\s+as\s+follows[:\s]+' + BLOCK_TEXT,
             re.IGNORECASE | re.DOTALL
         ),
         # "shall read as follows:"
         re.compile(
-            r'shall\s+read\s+as\s+follows[:\s]+(.+?)(?=\n\n|\Z)',
+            r'shall\s+read\s+as\s+follows[:\s]+' + BLOCK_TEXT,
             re.IGNORECASE | re.DOTALL
         ),
     ]
@@ -260,7 +306,7 @@ class AmendmentParser:
     ADD_AT_END_PATTERNS = [
         # "by adding at the end the following:"
         re.compile(
-            r'(?:by\s+)?adding\s+at\s+the\s+end\s+(?:thereof\s+)?(?:the\s+following[:\s]+)?(.+?)(?=\n\n|\Z)',
+            r'(?:by\s+)?adding\s+at\s+the\s+end\s+(?:thereof\s+)?(?:the\s+following[:\s]+)?' + BLOCK_TEXT,
             re.IGNORECASE | re.DOTALL
         ),
         # "by adding at the end:"
@@ -274,12 +320,14 @@ class AmendmentParser:
     ADD_AT_BEGINNING_PATTERNS = [
         # "by inserting at the beginning the following:"
         re.compile(
-            r'(?:by\s+)?(?:inserting|adding)\s+(?:at\s+)?the\s+beginning\s+(?:thereof\s+)?(?:the\s+following[:\s]+)?(.+?)(?=\n\n|\Z)',
+            r'(?:by\s+)?(?:inserting|adding)\s+(?:at\s+)?the\s+beginning\s+(?:thereof\s+)?(?:the\s+following[:\s]+)?' + BLOCK_TEXT,
             re.IGNORECASE | re.DOTALL
         ),
     ]
 
-    # Strike Only patterns
+    # Strike Only patterns. Kept separate per phrasing: a single alternation
+    # would only find non-overlapping matches, so an unbalanced quote in one
+    # phrasing could swallow the next instruction.
     STRIKE_PATTERNS = [
         # "by striking 'X'"
         re.compile(
@@ -351,7 +399,7 @@ class AmendmentParser:
         # "by striking subparagraph (E) and inserting the following:" - captures structural type
         # Handles truncated context where closing quote may be missing
         re.compile(
-            r'(?:by\s+)?striking\s+(subparagraph|paragraph|clause)\s*\(([A-Za-z0-9]+)\)\s+and\s+inserting\s+the\s+following:\s*\n*["\u201c](.+?)(?:["\u201d]|\Z)',
+            r'(?:by\s+)?striking\s+(subparagraph|paragraph|clause)\s*\(([A-Za-z0-9]+)\)\s+and\s+inserting\s+the\s+following:\s*\n*["\u201c]' + QUOTED_BLOCK_TEXT,
             re.IGNORECASE | re.DOTALL
         ),
         # "by striking subparagraph (E) and inserting 'X'" (inline) - captures structural type
@@ -411,33 +459,72 @@ class AmendmentParser:
     )
 
     # Pattern to detect if text is definitional (not an actual amendment)
-    DEFINITIONAL_PATTERNS = [
-        re.compile(r'\(as\s+defined\s+in\s+(?:section|paragraph)', re.IGNORECASE),
-        re.compile(r'has\s+the\s+meaning\s+given', re.IGNORECASE),
-        re.compile(r'the\s+term\s+["\'].+?["\']\s+means', re.IGNORECASE),
-        re.compile(r'for\s+purposes\s+of\s+this', re.IGNORECASE),
-        re.compile(r'under\s+(?:section|paragraph|subparagraph)', re.IGNORECASE),
-    ]
+    DEFINITIONAL_PATTERN = re.compile(
+        r'\(as\s+defined\s+in\s+(?:section|paragraph)'
+        r'|has\s+the\s+meaning\s+given'
+        r'|the\s+term\s+["\'].+?["\']\s+means'
+        r'|for\s+purposes\s+of\s+this'
+        r'|under\s+(?:section|paragraph|subparagraph)',
+        re.IGNORECASE
+    )
 
     # Pattern to detect actual amendment language
-    AMENDMENT_INDICATOR_PATTERNS = [
-        re.compile(r'is\s+amended', re.IGNORECASE),
-        re.compile(r'are\s+amended', re.IGNORECASE),
-        re.compile(r'is\s+hereby\s+amended', re.IGNORECASE),
-        re.compile(r'shall\s+be\s+amended', re.IGNORECASE),
-        re.compile(r'is\s+further\s+amended', re.IGNORECASE),  # Phase 1: further amended
-        re.compile(r'are\s+further\s+amended', re.IGNORECASE),  # Phase 1: further amended (plural)
-        re.compile(r'by\s+striking', re.IGNORECASE),
-        re.compile(r'by\s+inserting', re.IGNORECASE),
-        re.compile(r'by\s+adding', re.IGNORECASE),
-        re.compile(r'by\s+redesignating', re.IGNORECASE),
-        re.compile(r'by\s+designating', re.IGNORECASE),  # Phase 2: initial designation
-    ]
+    AMENDMENT_INDICATOR_PATTERN = re.compile(
+        r'is\s+(?:hereby\s+|further\s+)?amended'
+        r'|are\s+(?:further\s+)?amended'
+        r'|shall\s+be\s+amended'
+        r'|by\s+(?:striking|inserting|adding|redesignating|designating)',
+        re.IGNORECASE
+    )
+
+    # Keywords the pattern families depend on, found in one pass so families
+    # whose keyword is absent are skipped; text with none of them can't match
+    AMENDMENT_KEYWORD_PATTERN = re.compile(
+        r'(?P<strike>strik)|(?P<insert>insert)|(?P<add>adding)|(?P<delete>delet)'
+        r'|(?P<designate>designat)|(?P<read>read\s+as\s+follows)',
+        re.IGNORECASE
+    )
 
     # Pattern to detect numbered amendment lists: (1) by..., (2) by...
     # Handles both "is amended—" and "is further amended—"
+    # Item runs are possessive: each [^(] run can only end at a "(", so giving
+    # characters back could never start another "(N)" item
     NUMBERED_AMENDMENT_PATTERN = re.compile(
-        r'is\s+(?:further\s+)?amended[—\-:\s]+(?:\n\s*)?(\(\d+\)[^(]+(?:\(\d+\)[^(]+)*)',
+        r'is\s+(?:further\s+)?amended[—\-:\s]+(?:\n\s*)?(\(\d+\)[^(]++(?:\(\d+\)[^(]++)*+)',
+        re.IGNORECASE | re.DOTALL
+    )
+
+    # Keywords for _detect_from_keywords, found in one pass; "inserting after"
+    # and "redesignating" come first so they aren't consumed as the shorter word
+    FALLBACK_KEYWORD_PATTERN = re.compile(
+        r'(?P<insert_after>inserting after)|(?P<inserting>inserting)|(?P<striking>striking)'
+        r'|(?P<deleting>deleting)|(?P<read>read as follows)|(?P<add_at_end>adding at the end)'
+        r'|(?P<redesignating>redesignating)|(?P<designating>designating)',
+        re.IGNORECASE
+    )
+
+    # Item markers "(1) ", "(2) " that split a numbered amendment list
+    NUMBERED_ITEM_SPLIT_PATTERN = re.compile(r'\(\d+\)\s*')
+
+    # Patterns tried in order against each item of a numbered list
+    # "on subparagraph (X), by striking 'Y' at the end"
+    ITEM_STRIKE_AT_END_PATTERN = re.compile(
+        r'(?:on|in)\s+(?:subparagraph|paragraph|clause)\s*\(([A-Za-z0-9]+)\)[,\s]+(?:by\s+)?striking\s+["\']([^"\']+)["\'](?:\s+at\s+the\s+end)?',
+        re.IGNORECASE
+    )
+    # "on subparagraph (X), by striking the period at the end and inserting '; or'"
+    ITEM_STRIKE_WORD_INSERT_PATTERN = re.compile(
+        r'(?:on|in)\s+(?:subparagraph|paragraph|clause)\s*\(([A-Za-z0-9]+)\)(?:\s*\(([ivxlcdm0-9]+)\))?[,\s]+(?:by\s+)?striking\s+(?:the\s+)?(\w+)\s+at\s+the\s+end\s+and\s+inserting\s+["\']([^"\']+)["\']',
+        re.IGNORECASE
+    )
+    # "by adding at the end the following: '(F) ...'"
+    ITEM_ADD_AT_END_PATTERN = re.compile(
+        r'(?:by\s+)?adding\s+at\s+the\s+end\s+(?:the\s+following[:\s]+)?["\']?(.+?)["\']?\s*[\.;]?\s*$',
+        re.IGNORECASE | re.DOTALL
+    )
+    # "by striking subparagraph (E) and inserting the following:"
+    ITEM_STRIKE_SUBPARAGRAPH_PATTERN = re.compile(
+        r'(?:by\s+)?striking\s+(subparagraph|paragraph)\s*\(([A-Za-z0-9]+)\)\s+and\s+inserting\s+(?:the\s+following[:\s]+)?["\']?(.+?)["\']?\s*$',
         re.IGNORECASE | re.DOTALL
     )
 
@@ -451,14 +538,9 @@ class AmendmentParser:
         Returns:
             True if text appears to be definitional, False if it may contain amendments
         """
-        # Check for definitional patterns
-        for pattern in self.DEFINITIONAL_PATTERNS:
-            if pattern.search(text):
-                # But also check if there's amendment language
-                for amend_pattern in self.AMENDMENT_INDICATOR_PATTERNS:
-                    if amend_pattern.search(text):
-                        return False  # Has amendment language, not just definitional
-                return True
+        # Definitional wording only counts when there's no amendment language
+        if self.DEFINITIONAL_PATTERN.search(text):
+            return not self.is_amendment_context(text)
         return False
 
     def is_amendment_context(self, text: str) -> bool:
@@ -471,10 +553,37 @@ class AmendmentParser:
         Returns:
             True if text appears to contain amendment instructions
         """
-        for pattern in self.AMENDMENT_INDICATOR_PATTERNS:
-            if pattern.search(text):
-                return True
-        return False
+        return self.AMENDMENT_INDICATOR_PATTERN.search(text) is not None
+
+    def classify(self, text: str) -> ContextClassification:
+        """
+        Classify context text and parse it in one call.
+
+        Equivalent to calling is_definitional_reference, is_amendment_context
+        and parse in turn, but the indicator pattern is searched only once.
+
+        Args:
+            text: Context text to analyze
+
+        Returns:
+            ContextClassification; parse_result is None for definitional text
+        """
+        is_amendment = self.is_amendment_context(text)
+        # Amendment language always overrides a definitional match
+        if not is_amendment and self.DEFINITIONAL_PATTERN.search(text):
+            return ContextClassification(is_definitional=True)
+
+        normalized = self.normalize_quotes(text)
+        if text and normalized == text:
+            # Already known not to be definitional, so skip parse()'s recheck
+            parse_result = self._parse_normalized(text)
+        else:
+            parse_result = self.parse(text)
+
+        return ContextClassification(
+            is_amendment=is_amendment,
+            parse_result=parse_result,
+        )
 
     def parse(self, text: str) -> AmendmentParseResult:
         """
@@ -497,32 +606,62 @@ class AmendmentParser:
         text = self.normalize_quotes(text)
 
         # Check if this is just a definitional reference
-        if self.is_definitional_reference(text) and not self.is_amendment_context(text):
+        if self.is_definitional_reference(text):
             return AmendmentParseResult(
                 success=False,
                 error_message="Text appears to be a definitional reference, not an amendment"
             )
 
+        return self._parse_normalized(text)
+
+    def _parse_normalized(self, text: str) -> AmendmentParseResult:
+        """
+        Run the amendment patterns over quote-normalized, non-definitional text.
+
+        Wrapped in a per-instance LRU cache by __init__.
+        """
+        keywords = {match.lastgroup for match in self.AMENDMENT_KEYWORD_PATTERN.finditer(text)}
+        if not keywords:
+            # Nothing below could match
+            return AmendmentParseResult(unparsed_text=text, success=False)
+
+        # Several families only have patterns built on QUOTE_PATTERN
+        has_quotes = any(quote in text for quote in self.QUOTE_CHARS)
+        has_strike = "strike" in keywords
+        has_quoted_strike = has_strike and has_quotes
+        has_quoted_insert = "insert" in keywords and has_quotes
+        has_add = "add" in keywords
+        has_designate = "designate" in keywords
+
         amendments = []
 
         # First, try to parse numbered amendment lists (most common in real bills)
         amendments.extend(self._parse_numbered_amendments(text))
 
-        # Try each pattern type
-        amendments.extend(self._parse_strike_insert(text))
-        amendments.extend(self._parse_strike_end_insert(text))
-        amendments.extend(self._parse_strike_through_end(text))
-        amendments.extend(self._parse_strike_subparagraphs(text))
-        amendments.extend(self._parse_subparagraph_amendments(text))
-        amendments.extend(self._parse_insert_after(text))
-        amendments.extend(self._parse_insert_before(text))
-        amendments.extend(self._parse_read_as_follows(text))
-        amendments.extend(self._parse_add_at_end(text))
-        amendments.extend(self._parse_add_at_beginning(text))
-        amendments.extend(self._parse_strike_only(text))
-        amendments.extend(self._parse_strike_each_place(text))
-        amendments.extend(self._parse_redesignate(text))
-        amendments.extend(self._parse_designate(text))  # Phase 2
+        # Try each pattern type whose keyword appears in the text
+        if has_quoted_strike:
+            amendments.extend(self._parse_strike_insert(text))
+            amendments.extend(self._parse_strike_end_insert(text))
+            amendments.extend(self._parse_strike_through_end(text))
+        if has_strike:
+            amendments.extend(self._parse_strike_subparagraphs(text))
+            amendments.extend(self._parse_subparagraph_amendments(text))
+        if has_quoted_insert:
+            amendments.extend(self._parse_insert_after(text))
+            amendments.extend(self._parse_insert_before(text))
+        if "read" in keywords:
+            amendments.extend(self._parse_read_as_follows(text))
+        if has_add:
+            amendments.extend(self._parse_add_at_end(text))
+        if "insert" in keywords or has_add:
+            amendments.extend(self._parse_add_at_beginning(text))
+        if has_quotes and (has_strike or "delete" in keywords):
+            amendments.extend(self._parse_strike_only(text))
+        if has_quoted_strike:
+            amendments.extend(self._parse_strike_each_place(text))
+        if has_designate:
+            amendments.extend(self._parse_redesignate(text))
+            amendments.extend(self._parse_designate(text))  # Phase 2
 
         # Deduplicate amendments (some may be captured by multiple patterns)
         amendments = self._deduplicate_amendments(amendments)
@@ -534,13 +673,17 @@ class AmendmentParser:
                 amendments.append(amendment)
 
         # Extract target section references
-        for amendment in amendments:
+        if amendments:
             section_match = self.SECTION_REF_PATTERN.search(text)
             if section_match:
-                amendment.target_section = section_match.group(0)
+                target_section = section_match.group(0)
+                amendments = [
+                    dataclasses.replace(amendment, target_section=target_section)
+                    for amendment in amendments
+                ]
 
         return AmendmentParseResult(
-            amendments=amendments,
+            amendments=tuple(amendments),
             unparsed_text=text if not amendments else "",
             success=len(amendments) > 0
         )
@@ -559,10 +702,12 @@ class AmendmentParser:
     def _parse_strike_insert(self, text: str) -> List[ParsedAmendment]:
         """Parse strike-and-insert amendments."""
         amendments = []
+        append = amendments.append
+        amendment_type = AmendmentType.STRIKE_INSERT
         for pattern in self.STRIKE_INSERT_PATTERNS:
             for match in pattern.finditer(text):
-                amendments.append(ParsedAmendment(
-                    amendment_type=AmendmentType.STRIKE_INSERT,
+                append(ParsedAmendment(
+                    amendment_type=amendment_type,
                     text_to_strike=match.group(1).strip(),
                     text_to_insert=match.group(2).strip(),
                     raw_instruction=match.group(0),
@@ -585,7 +730,7 @@ class AmendmentParser:
         if match:
             numbered_text = match.group(1)
             # Split by numbered items: (1), (2), (3), etc.
-            items = re.split(r'\(\d+\)\s*', numbered_text)
+            items = self.NUMBERED_ITEM_SPLIT_PATTERN.split(numbered_text)
             items = [item.strip() for item in items if item.strip()]
 
             for item in items:
@@ -600,10 +745,7 @@ class AmendmentParser:
         amendments = []
 
         # Pattern: "on subparagraph (X), by striking 'Y' at the end"
-        strike_at_end_match = re.search(
-            r'(?:on|in)\s+(?:subparagraph|paragraph|clause)\s*\(([A-Za-z0-9]+)\)[,\s]+(?:by\s+)?striking\s+["\']([^"\']+)["\'](?:\s+at\s+the\s+end)?',
-            item, re.IGNORECASE
-        )
+        strike_at_end_match = self.ITEM_STRIKE_AT_END_PATTERN.search(item)
         if strike_at_end_match:
             amendments.append(ParsedAmendment(
                 amendment_type=AmendmentType.STRIKE,
@@ -615,10 +757,7 @@ class AmendmentParser:
             return amendments
 
         # Pattern: "on subparagraph (X), by striking the period at the end and inserting '; or'"
-        strike_word_insert_match = re.search(
-            r'(?:on|in)\s+(?:subparagraph|paragraph|clause)\s*\(([A-Za-z0-9]+)\)(?:\s*\(([ivxlcdm0-9]+)\))?[,\s]+(?:by\s+)?striking\s+(?:the\s+)?(\w+)\s+at\s+the\s+end\s+and\s+inserting\s+["\']([^"\']+)["\']',
-            item, re.IGNORECASE
-        )
+        strike_word_insert_match = self.ITEM_STRIKE_WORD_INSERT_PATTERN.search(item)
         if strike_word_insert_match:
             subpara = strike_word_insert_match.group(1)
             clause = strike_word_insert_match.group(2)
@@ -627,7 +766,7 @@ class AmendmentParser:
             target = f"subparagraph ({subpara})" + (f"({clause})" if clause else "")
 
             # Map common words to actual characters
-            strike_text = {"period": ".", "comma": ",", "semicolon": ";"}.get(word_to_strike.lower(), word_to_strike)
+            strike_text = _WORD_TO_CHAR.get(word_to_strike.lower(), word_to_strike)
 
             amendments.append(ParsedAmendment(
                 amendment_type=AmendmentType.STRIKE_INSERT,
@@ -640,10 +779,7 @@ class AmendmentParser:
             return amendments
 
         # Pattern: "by adding at the end the following: '(F) ...'""
-        add_at_end_match = re.search(
-            r'(?:by\s+)?adding\s+at\s+the\s+end\s+(?:the\s+following[:\s]+)?["\']?(.+?)["\']?\s*[\.;]?\s*$',
-            item, re.IGNORECASE | re.DOTALL
-        )
+        add_at_end_match = self.ITEM_ADD_AT_END_PATTERN.search(item)
         if add_at_end_match:
             amendments.append(ParsedAmendment(
                 amendment_type=AmendmentType.ADD_AT_END,
@@ -655,10 +791,7 @@ class AmendmentParser:
 
         # Pattern: "by striking subparagraph (E) and inserting the following:"
         # Captures both the structural type (subparagraph/paragraph) and the identifier
-        strike_subpara_match = re.search(
-            r'(?:by\s+)?striking\s+(subparagraph|paragraph)\s*\(([A-Za-z0-9]+)\)\s+and\s+inserting\s+(?:the\s+following[:\s]+)?["\']?(.+?)["\']?\s*$',
-            item, re.IGNORECASE | re.DOTALL
-        )
+        strike_subpara_match = self.ITEM_STRIKE_SUBPARAGRAPH_PATTERN.search(item)
         if strike_subpara_match:
             struct_type = strike_subpara_match.group(1).lower()  # "subparagraph" or "paragraph"
             struct_id = strike_subpara_match.group(2)
@@ -685,7 +818,7 @@ class AmendmentParser:
                     word_to_strike = groups[0]
                     text_to_insert = groups[1]
                     # Map common words to characters
-                    strike_text = {"period": ".", "comma": ",", "semicolon": ";"}.get(word_to_strike.lower(), word_to_strike)
+                    strike_text = _WORD_TO_CHAR.get(word_to_strike.lower(), word_to_strike)
                     amendments.append(ParsedAmendment(
                         amendment_type=AmendmentType.STRIKE_INSERT,
                         text_to_strike=strike_text,
@@ -754,9 +887,8 @@ class AmendmentParser:
                         word_to_strike = groups[2]
                         word_to_insert = groups[3]
                         # Map common word names to actual characters
-                        word_map = {"period": ".", "comma": ",", "semicolon": ";", "colon": ":"}
-                        strike_text = word_map.get(word_to_strike.lower(), word_to_strike)
-                        insert_text = word_map.get(word_to_insert.lower(), word_to_insert)
+                        strike_text = _WORD_TO_CHAR.get(word_to_strike.lower(), word_to_strike)
+                        insert_text = _WORD_TO_CHAR.get(word_to_insert.lower(), word_to_insert)
                         target = f"subparagraph ({subpara})" + (f"({clause})" if clause else "")
                         amendments.append(ParsedAmendment(
                             amendment_type=AmendmentType.STRIKE_INSERT,
@@ -771,10 +903,12 @@ class AmendmentParser:
     def _parse_insert_after(self, text: str) -> List[ParsedAmendment]:
         """Parse insert-after amendments."""
         amendments = []
+        append = amendments.append
+        amendment_type = AmendmentType.INSERT_AFTER
         for pattern in self.INSERT_AFTER_PATTERNS:
             for match in pattern.finditer(text):
-                amendments.append(ParsedAmendment(
-                    amendment_type=AmendmentType.INSERT_AFTER,
+                append(ParsedAmendment(
+                    amendment_type=amendment_type,
                     position_marker=match.group(1).strip(),
                     text_to_insert=match.group(2).strip(),
                     raw_instruction=match.group(0),
@@ -785,10 +919,12 @@ class AmendmentParser:
     def _parse_insert_before(self, text: str) -> List[ParsedAmendment]:
         """Parse insert-before amendments."""
         amendments = []
+        append = amendments.append
+        amendment_type = AmendmentType.INSERT_BEFORE
         for pattern in self.INSERT_BEFORE_PATTERNS:
             for match in pattern.finditer(text):
-                amendments.append(ParsedAmendment(
-                    amendment_type=AmendmentType.INSERT_BEFORE,
+                append(ParsedAmendment(
+                    amendment_type=amendment_type,
                     position_marker=match.group(1).strip(),
                     text_to_insert=match.group(2).strip(),
                     raw_instruction=match.group(0),
@@ -799,10 +935,12 @@ class AmendmentParser:
     def _parse_read_as_follows(self, text: str) -> List[ParsedAmendment]:
         """Parse read-as-follows amendments (full replacement)."""
         amendments = []
+        append = amendments.append
+        amendment_type = AmendmentType.READ_AS_FOLLOWS
         for pattern in self.READ_AS_FOLLOWS_PATTERNS:
             for match in pattern.finditer(text):
-                amendments.append(ParsedAmendment(
-                    amendment_type=AmendmentType.READ_AS_FOLLOWS,
+                append(ParsedAmendment(
+                    amendment_type=amendment_type,
                     text_to_insert=match.group(1).strip(),
                     raw_instruction=match.group(0),
                     confidence=0.85  # Lower confidence - full text replacement
@@ -812,10 +950,12 @@ class AmendmentParser:
     def _parse_add_at_end(self, text: str) -> List[ParsedAmendment]:
         """Parse add-at-end amendments."""
         amendments = []
+        append = amendments.append
+        amendment_type = AmendmentType.ADD_AT_END
         for pattern in self.ADD_AT_END_PATTERNS:
             for match in pattern.finditer(text):
-                amendments.append(ParsedAmendment(
-                    amendment_type=AmendmentType.ADD_AT_END,
+                append(ParsedAmendment(
+                    amendment_type=amendment_type,
                     text_to_insert=match.group(1).strip(),
                     raw_instruction=match.group(0),
                     confidence=0.9
@@ -825,10 +965,12 @@ class AmendmentParser:
     def _parse_add_at_beginning(self, text: str) -> List[ParsedAmendment]:
         """Parse add-at-beginning amendments."""
         amendments = []
+        append = amendments.append
+        amendment_type = AmendmentType.ADD_AT_BEGINNING
         for pattern in self.ADD_AT_BEGINNING_PATTERNS:
             for match in pattern.finditer(text):
-                amendments.append(ParsedAmendment(
-                    amendment_type=AmendmentType.ADD_AT_BEGINNING,
+                append(ParsedAmendment(
+                    amendment_type=amendment_type,
                     text_to_insert=match.group(1).strip(),
                     raw_instruction=match.group(0),
                     confidence=0.9
@@ -838,10 +980,12 @@ class AmendmentParser:
     def _parse_strike_only(self, text: str) -> List[ParsedAmendment]:
         """Parse strike-only amendments (deletion without insertion)."""
         amendments = []
+        append = amendments.append
+        amendment_type = AmendmentType.STRIKE
         for pattern in self.STRIKE_PATTERNS:
             for match in pattern.finditer(text):
-                amendments.append(ParsedAmendment(
-                    amendment_type=AmendmentType.STRIKE,
+                append(ParsedAmendment(
+                    amendment_type=amendment_type,
                     text_to_strike=match.group(1).strip(),
                     raw_instruction=match.group(0),
                     confidence=0.9
@@ -932,10 +1076,12 @@ class AmendmentParser:
     def _parse_redesignate(self, text: str) -> List[ParsedAmendment]:
         """Parse redesignation amendments (renumbering/reordering existing elements)."""
         amendments = []
+        append = amendments.append
+        amendment_type = AmendmentType.REDESIGNATE
         for pattern in self.REDESIGNATE_PATTERNS:
             for match in pattern.finditer(text):
-                amendments.append(ParsedAmendment(
-                    amendment_type=AmendmentType.REDESIGNATE,
+                append(ParsedAmendment(
+                    amendment_type=amendment_type,
                     text_to_strike=match.group(1).strip(),
                     text_to_insert=match.group(2).strip(),
                     raw_instruction=match.group(0),
@@ -969,52 +1115,34 @@ class AmendmentParser:
 
     def _detect_from_keywords(self, text: str) -> Optional[ParsedAmendment]:
         """Detect amendment type from keywords when patterns don't match."""
-        text_lower = text.lower()
-
-        if "striking" in text_lower and "inserting" in text_lower:
-            return ParsedAmendment(
-                amendment_type=AmendmentType.STRIKE_INSERT,
-                raw_instruction=text[:200],
-                confidence=0.5
-            )
-        elif "inserting after" in text_lower:
-            return ParsedAmendment(
-                amendment_type=AmendmentType.INSERT_AFTER,
-                raw_instruction=text[:200],
-                confidence=0.5
-            )
-        elif "read as follows" in text_lower:
-            return ParsedAmendment(
-                amendment_type=AmendmentType.READ_AS_FOLLOWS,
-                raw_instruction=text[:200],
-                confidence=0.5
-            )
-        elif "adding at the end" in text_lower:
-            return ParsedAmendment(
-                amendment_type=AmendmentType.ADD_AT_END,
-                raw_instruction=text[:200],
-                confidence=0.5
-            )
-        elif "striking" in text_lower or "deleting" in text_lower:
-            return ParsedAmendment(
-                amendment_type=AmendmentType.STRIKE,
-                raw_instruction=text[:200],
-                confidence=0.5
-            )
-        elif "redesignating" in text_lower:
-            return ParsedAmendment(
-                amendment_type=AmendmentType.REDESIGNATE,
-                raw_instruction=text[:200],
-                confidence=0.5
-            )
-        elif "designating" in text_lower:
-            return ParsedAmendment(
-                amendment_type=AmendmentType.DESIGNATE,
-                raw_instruction=text[:200],
-                confidence=0.5
-            )
+        found = {match.lastgroup for match in self.FALLBACK_KEYWORD_PATTERN.finditer(text)}
+        if not found:
+            return None
+        if "insert_after" in found:
+            found.add("inserting")
+
+        if "striking" in found and "inserting" in found:
+            amendment_type = AmendmentType.STRIKE_INSERT
+        elif "insert_after" in found:
+            amendment_type = AmendmentType.INSERT_AFTER
+        elif "read" in found:
+            amendment_type = AmendmentType.READ_AS_FOLLOWS
+        elif "add_at_end" in found:
+            amendment_type = AmendmentType.ADD_AT_END
+        elif "striking" in found or "deleting" in found:
+            amendment_type = AmendmentType.STRIKE
+        elif "redesignating" in found:
+            amendment_type = AmendmentType.REDESIGNATE
+        elif "designating" in found:
+            amendment_type = AmendmentType.DESIGNATE
+        else:
+            return None
 
-        return None
+        return ParsedAmendment(
+            amendment_type=amendment_type,
+            raw_instruction=text[:200],
+            confidence=0.5
+        )
 
 
 class AmendmentApplier:
@@ -1028,7 +1156,8 @@ class AmendmentApplier:
 
     Usage:
         applier = AmendmentApplier()
-        amended_text = applier.apply(original_text, parsed_amendment)
+        amended_text, success = applier.apply(original_text, parsed_amendment)
+        amended_text, results = applier.apply_batch(original_text, amendments)
     """
 
     # Patterns to find structural elements in statute text
@@ -1078,6 +1207,175 @@ class AmendmentApplier:
             logger.error(f"Error applying amendment: {e}")
             return original_text, False
 
+    def apply_batch(
+        self, original_text: str, amendments: List[ParsedAmendment]
+    ) -> Tuple[str, List[bool]]:
+        """
+        Apply several amendments to the same text, in order.
+
+        Each amendment is applied to the text left by the ones before it,
+        the way the numbered instructions of an amending section are read.
+
+        Args:
+            original_text: The original statute text
+            amendments: The parsed amendments to apply
+
+        Returns:
+            Tuple of (amended_text, success flag per amendment)
+        """
+        text = original_text
+        results = []
+        for amendment in amendments:
+            text, success = self.apply(text, amendment)
+            results.append(success)
+        return text, results
+
+    def apply_all(
+        self, original_text: str, amendments: List[ParsedAmendment]
+    ) -> Tuple[str, List[bool]]:
+        """
+        Apply several amendments to the same text in one rebuild.
+
+        Every amendment is located in the original text and the edits are
+        spliced together with a single join, instead of copying the whole
+        text once per amendment. The result always equals apply_batch's:
+        falls back to apply_batch when any amendment is not a single literal
+        edit, cannot be found, or lies near another edit, or when an edit
+        could create a new match for a later amendment's text.
+
+        Args:
+            original_text: The original statute text
+            amendments: The parsed amendments to apply
+
+        Returns:
+            Tuple of (amended_text, success flag per amendment)
+        """
+        edits = []
+        needles = []
+        for amendment in amendments:
+            located = self._locate_literal(original_text, amendment) if amendment.is_valid else None
+            if located is None:
+                return self.apply_batch(original_text, amendments)
+            (match_start, match_end), edit = located
+            # The span an amendment touches covers both the text it matched
+            # and the edit, e.g. the marker of an insert-after
+            edits.append((min(match_start, edit[0]), max(match_end, edit[1]), edit))
+            needles.append(self._literal_needle(amendment).casefold())
+
+        # Applied in sequence, a later amendment could instead match text an
+        # earlier edit creates: inside its replacement, or across either end
+        # of it. Any such match lies within len(needle) - 1 characters of
+        # the edit, so check that window
+        for index, (_, _, (start, end, replacement)) in enumerate(edits):
+            for needle in needles[index + 1:]:
+                reach = len(needle) - 1
+                window = original_text[max(0, start - reach):start] + replacement + original_text[end:end + reach]
+                if needle in window.casefold():
+                    return self.apply_batch(original_text, amendments)
+
+        # No edit may touch text another amendment matched, and edits must
+        # be far enough apart that the windows above only ever saw original
+        # text around each edit
+        gap = max(max(len(needle) for needle in needles) - 1, 1)
+        edits.sort(key=lambda edit: edit[0])
+        parts = []
+        cursor = 0
+        touched_end = None
+        for touched_start, touched_end_next, (start, end, replacement) in edits:
+            if touched_end is not None and touched_start - touched_end < gap:
+                return self.apply_batch(original_text, amendments)
+            touched_end = touched_end_next
+            parts.append(original_text[cursor:start])
+            parts.append(replacement)
+            cursor = end
+        parts.append(original_text[cursor:])
+        return "".join(parts), [True] * len(amendments)
+
+    @staticmethod
+    def _literal_needle(amendment: ParsedAmendment) -> str:
+        """Text a literal amendment is located by."""
+        if amendment.amendment_type in (AmendmentType.STRIKE_INSERT, AmendmentType.STRIKE):
+            return amendment.text_to_strike
+        return amendment.position_marker
+
+    def _find_literal(self, text: str, needle: str) -> Optional[Tuple[int, int]]:
+        """Find the first occurrence of needle, falling back to a case-insensitive match."""
+        pos = text.find(needle)
+        if pos != -1:
+            return pos, pos + len(needle)
+        # Offsets in the casefolded copies only line up with text while
+        # folding keeps every length (it doesn't for e.g. "\u00df")
+        text_folded = text.casefold()
+        needle_folded = needle.casefold()
+        if len(text_folded) == len(text) and len(needle_folded) == len(needle):
+            pos = text_folded.find(needle_folded)
+            if pos == -1:
+                return None
+            return pos, pos + len(needle)
+        match = _ci_pattern(needle).search(text)
+        if match:
+            return match.span()
+        return None
+
+    def _literal_edit(self, text: str, amendment: ParsedAmendment) -> Optional[Tuple[int, int, str]]:
+        """
+        Locate an amendment that replaces a single literal span of text.
+
+        Returns: (start, end, replacement) or None if the amendment is of
+        another kind (structural, "each place", whole-text) or is not found
+        """
+        located = self._locate_literal(text, amendment)
+        return located[1] if located else None
+
+    def _locate_literal(
+        self, text: str, amendment: ParsedAmendment
+    ) -> Optional[Tuple[Tuple[int, int], Tuple[int, int, str]]]:
+        """
+        Like _literal_edit, also returning where the amendment's text matched.
+
+        Returns: ((match_start, match_end), (start, end, replacement)) or None
+        """
+        amendment_type = amendment.amendment_type
+        if amendment_type in (AmendmentType.STRIKE_INSERT, AmendmentType.STRIKE):
+            # Mirrors the special cases _apply_strike_insert/_apply_strike handle first
+            strike_text = amendment.text_to_strike
+            if "[each place it appears]" in strike_text:
+                return None
+            if amendment_type == AmendmentType.STRIKE:
+                if strike_text.startswith(("subparagraph", "paragraph", "subsection")):
+                    return None
+                replacement = ""
+            else:
+                if "[and all that follows through end]" in strike_text:
+                    return None
+                if strike_text.startswith(("subparagraph (", "paragraph (", "subsection (")):
+                    return None
+                replacement = amendment.text_to_insert
+            span = self._find_literal(text, strike_text)
+            if span is None:
+                return None
+            return span, (span[0], span[1], replacement)
+
+        if amendment_type == AmendmentType.INSERT_AFTER:
+            span = self._find_literal(text, amendment.position_marker)
+            if span is None:
+                return None
+            insert_text = amendment.text_to_insert
+            if not insert_text.startswith(" "):
+                insert_text = " " + insert_text
+            return span, (span[1], span[1], insert_text)
+
+        if amendment_type == AmendmentType.INSERT_BEFORE:
+            span = self._find_literal(text, amendment.position_marker)
+            if span is None:
+                return None
+            insert_text = amendment.text_to_insert
+            if not insert_text.endswith(" "):
+                insert_text = insert_text + " "
+            return span, (span[0], span[0], insert_text)
+
+        return None
+
     def _apply_strike_insert(self, text: str, amendment: ParsedAmendment) -> Tuple[str, bool]:
         """Replace struck text with inserted text."""
         strike_text = amendment.text_to_strike
@@ -1093,9 +1391,11 @@ class AmendmentApplier:
             actual_text = strike_text.replace(" [each place it appears]", "")
             if actual_text in text:
                 return text.replace(actual_text, insert_text), True
-            pattern = re.compile(re.escape(actual_text), re.IGNORECASE)
-            if pattern.search(text):
-                return pattern.sub(insert_text, text), True
+            # One pass that also reports whether anything matched; the
+            # callable keeps insert_text literal
+            amended, count = _ci_pattern(actual_text).subn(lambda _: insert_text, text)
+            if count:
+                return amended, True
             logger.warning(f"Could not find text to strike: '{actual_text[:50]}...'")
             return text, False
 
@@ -1108,14 +1408,10 @@ class AmendmentApplier:
         if is_structural:
             return self._apply_structural_strike_insert(text, strike_text, insert_text)
 
-        # Standard text replacement
-        if strike_text in text:
-            return text.replace(strike_text, insert_text, 1), True
-
-        # Try case-insensitive match
-        pattern = re.compile(re.escape(strike_text), re.IGNORECASE)
-        if pattern.search(text):
-            return pattern.sub(insert_text, text, count=1), True
+        # Standard text replacement, falling back to a case-insensitive match
+        span = self._find_literal(text, strike_text)
+        if span:
+            return text[:span[0]] + insert_text + text[span[1]:], True
 
         logger.warning(f"Could not find text to strike: '{strike_text[:50]}...'")
         return text, False
@@ -1240,35 +1536,18 @@ class AmendmentApplier:
 
     def _apply_insert_after(self, text: str, amendment: ParsedAmendment) -> Tuple[str, bool]:
         """Insert text after the position marker."""
-        insert_text = " " + amendment.text_to_insert if not amendment.text_to_insert.startswith(" ") else amendment.text_to_insert
-        if amendment.position_marker in text:
-            return text.replace(
-                amendment.position_marker,
-                amendment.position_marker + insert_text,
-                1
-            ), True
-        # Try case-insensitive
-        pattern = re.compile(re.escape(amendment.position_marker), re.IGNORECASE)
-        match = pattern.search(text)
-        if match:
-            pos = match.end()
+        edit = self._literal_edit(text, amendment)
+        if edit:
+            pos, _, insert_text = edit
             return text[:pos] + insert_text + text[pos:], True
         logger.warning(f"Could not find position marker: '{amendment.position_marker}'")
         return text, False
 
     def _apply_insert_before(self, text: str, amendment: ParsedAmendment) -> Tuple[str, bool]:
         """Insert text before the position marker."""
-        insert_text = amendment.text_to_insert + " " if not amendment.text_to_insert.endswith(" ") else amendment.text_to_insert
-        if amendment.position_marker in text:
-            return text.replace(
-                amendment.position_marker,
-                insert_text + amendment.position_marker,
-                1
-            ), True
-        pattern = re.compile(re.escape(amendment.position_marker), re.IGNORECASE)
-        match = pattern.search(text)
-        if match:
-            pos = match.start()
+        edit = self._literal_edit(text, amendment)
+        if edit:
+            pos, _, insert_text = edit
             return text[:pos] + insert_text + text[pos:], True
         logger.warning(f"Could not find position marker: '{amendment.position_marker}'")
         return text, False
@@ -1299,9 +1578,9 @@ class AmendmentApplier:
             actual_text = strike_text.replace(" [each place it appears]", "")
             if actual_text in text:
                 return text.replace(actual_text, ""), True
-            pattern = re.compile(re.escape(actual_text), re.IGNORECASE)
-            if pattern.search(text):
-                return pattern.sub("", text), True
+            amended, count = _ci_pattern(actual_text).subn("", text)
+            if count:
+                return amended, True
             logger.warning(f"Could not find text to strike: '{actual_text[:50]}...'")
             return text, False
 
@@ -1309,12 +1588,10 @@ class AmendmentApplier:
         if is_structural:
             return self._apply_structural_strike(text, strike_text)
 
-        # Standard text removal
-        if strike_text in text:
-            return text.replace(strike_text, "", 1), True
-        pattern = re.compile(re.escape(strike_text), re.IGNORECASE)
-        if pattern.search(text):
-            return pattern.sub("", text, count=1), True
+        # Standard text removal, falling back to a case-insensitive match
+        span = self._find_literal(text, strike_text)
+        if span:
+            return text[:span[0]] + text[span[1]:], True
         logger.warning(f"Could not find text to strike: '{strike_text[:50]}...'")
         return text, False
 
@@ -95,6 +95,17 @@ class CitationDetector:
     # Amendment action words that should NOT be treated as section boundaries
     AMENDMENT_ACTION_WORDS = {'by', 'in', 'on', 'at', 'and', 'or', 'to', 'for', 'the'}
 
+    # Sample text touching every citation pattern, used by warmup()
+    _WARMUP_TEXT = (
+        "SEC. 101. Section 501(c)(3) of the Internal Revenue Code (26 U.S.C. 501(c)(3)) "
+        "is amended by striking \"the\" and inserting \"a\". See Title 26, Section 501, "
+        "section 1 of title 42, 42 C.F.R. 482.12 and Pub. L. 117-169.\n(b) General"
+    )
+
+    def warmup(self) -> None:
+        """Run one detection so the first real request doesn't pay for cold paths."""
+        self.detect_all(self._WARMUP_TEXT)
+
     def detect_all(self, text: str) -> List[DetectedCitation]:
         """
         Detect all citations in the given text.
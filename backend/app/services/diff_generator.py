@@ -20,8 +20,17 @@ from enum import Enum
 
 from diff_match_patch import diff_match_patch
 
+try:
+    import fast_diff_match_patch
+except ImportError:  # pragma: no cover - compiled backend is optional
+    fast_diff_match_patch = None
+
 logger = logging.getLogger(__name__)
 
+# Operation codes returned by fast_diff_match_patch, mapped to the
+# diff-match-patch constants used throughout this module
+_FAST_DIFF_OPS = {"-": -1, "=": 0, "+": 1}
+
 
 class DiffOperation(int, Enum):
     """Diff operation types matching diff-match-patch constants."""
@@ -55,7 +64,8 @@ class DiffGenerator:
         self,
         semantic_cleanup: bool = True,
         efficiency_cleanup: bool = True,
-        edit_cost: int = 4
+        edit_cost: int = 4,
+        timeout: float = 0.25
     ):
         """
         Initialize the diff generator.
@@ -64,12 +74,34 @@ class DiffGenerator:
             semantic_cleanup: Clean up diffs for human readability
             efficiency_cleanup: Clean up diffs for machine efficiency
             edit_cost: Cost threshold for edit cleanup (higher = more consolidation)
+            timeout: Seconds diff-match-patch may spend on one diff before
+                settling for a coarser result (0 = no limit)
         """
         self.dmp = diff_match_patch()
+        self.dmp.Diff_Timeout = timeout
+        self.dmp.Diff_EditCost = edit_cost
         self.semantic_cleanup = semantic_cleanup
         self.efficiency_cleanup = efficiency_cleanup
         self.edit_cost = edit_cost
 
+    def _diff_main(self, original: str, amended: str) -> List[Tuple[int, str]]:
+        """
+        Compute the raw diff, using the compiled backend when installed.
+
+        Cleanups still run through the pure-Python instance so both
+        backends share the same post-processing.
+        """
+        if fast_diff_match_patch is None:
+            return self.dmp.diff_main(original, amended)
+        diffs = fast_diff_match_patch.diff(
+            original, amended,
+            timelimit=self.dmp.Diff_Timeout,
+            checklines=True,
+            cleanup="No",
+            counts_only=False,
+        )
+        return [(_FAST_DIFF_OPS[op], text) for op, text in diffs]
+
     def generate(
         self,
         original: str,
@@ -123,8 +155,17 @@ class DiffGenerator:
             original = original[:max_length]
             amended = amended[:max_length]
 
+        # Identical texts: nothing to diff
+        if original == amended:
+            return DiffResult(
+                html=html.escape(original),
+                has_changes=False,
+                original_length=len(original),
+                amended_length=len(amended)
+            )
+
         # Compute diff
-        diffs = self.dmp.diff_main(original, amended)
+        diffs = self._diff_main(original, amended)
 
         # Apply cleanups for better readability
         if self.semantic_cleanup:
@@ -134,23 +175,7 @@ class DiffGenerator:
             self.dmp.diff_cleanupEfficiency(diffs)
 
         # Convert to HTML
-        html_parts = []
-        deletions = 0
-        insertions = 0
-
-        for op, text in diffs:
-            escaped_text = html.escape(text)
-
-            if op == DiffOperation.DELETE:
-                html_parts.append(f'<del class="redline-deleted">{escaped_text}</del>')
-                deletions += len(text.split())
-            elif op == DiffOperation.INSERT:
-                html_parts.append(f'<ins class="redline-inserted">{escaped_text}</ins>')
-                insertions += len(text.split())
-            else:  # EQUAL
-                html_parts.append(escaped_text)
-
-        html_output = "".join(html_parts)
+        html_output, deletions, insertions = _render_diffs(diffs)
         has_changes = deletions > 0 or insertions > 0
 
         return DiffResult(
@@ -183,7 +208,7 @@ class DiffGenerator:
             original = original[:max_length]
             amended = amended[:max_length]
 
-        diffs = self.dmp.diff_main(original, amended)
+        diffs = self._diff_main(original, amended)
 
         if self.semantic_cleanup:
             self.dmp.diff_cleanupSemantic(diffs)
@@ -225,7 +250,7 @@ class DiffGenerator:
         Returns:
             HTML string with context-aware diff
         """
-        diffs = self.dmp.diff_main(original, amended)
+        diffs = self._diff_main(original, amended)
 
         if self.semantic_cleanup:
             self.dmp.diff_cleanupSemantic(diffs)
@@ -266,6 +291,40 @@ class DiffGenerator:
         return "".join(html_parts)
 
 
+def _render_diffs(diffs: List[Tuple[int, str]]) -> Tuple[str, int, int]:
+    """
+    Render diff operations as redline HTML.
+
+    Returns:
+        Tuple of (html, deleted word count, inserted word count)
+    """
+    escape = html.escape
+    parts = []
+    append = parts.append
+    deletions = 0
+    insertions = 0
+
+    for op, text in diffs:
+        if op == 0:  # EQUAL
+            append(escape(text))
+        elif op < 0:  # DELETE
+            append('<del class="redline-deleted">')
+            append(escape(text))
+            append('</del>')
+            deletions += len(text.split())
+        else:  # INSERT
+            append('<ins class="redline-inserted">')
+            append(escape(text))
+            append('</ins>')
+            insertions += len(text.split())
+
+    return "".join(parts), deletions, insertions
+
+
+# Shared generator for the convenience functions; it holds no per-diff state
+_default_generator = DiffGenerator()
+
+
 def generate_redline_html(
     original: str,
     amended: str,
@@ -284,20 +343,17 @@ def generate_redline_html(
     Returns:
         HTML string with redline markup
     """
-    generator = DiffGenerator()
-    result = generator.generate(original, amended, max_length=max_length)
+    result = _default_generator.generate(original, amended, max_length=max_length)
 
     # Wrap in container with metadata
     type_note = f'<p class="redline-type">Amendment type: {amendment_type}</p>' if amendment_type else ""
 
     if not result.has_changes:
-        return f'''
-<div class="redline-container">
-    {type_note}
-    <p class="redline-note">No changes detected between original and amended text.</p>
-    <div class="redline-content">{result.html}</div>
-</div>
-'''
+        return _unchanged_container(
+            "No changes detected between original and amended text.",
+            result.html,
+            type_note,
+        )
 
     return f'''
 <div class="redline-container">
@@ -309,3 +365,32 @@ def generate_redline_html(
     <div class="redline-content">{result.html}</div>
 </div>
 '''
+
+
+def generate_unchanged_html(text: str, note: str, max_length: int = 0) -> str:
+    """
+    Generate redline HTML that shows text without any diff markup.
+
+    Args:
+        text: Text to display
+        note: Explanation shown above the text
+        max_length: Maximum text length (0 = no limit)
+
+    Returns:
+        HTML string in the same container format as generate_redline_html
+    """
+    content = html.escape(text[:max_length] if max_length else text)
+    if max_length and len(text) > max_length:
+        content += "..."
+    return _unchanged_container(note, content)
+
+
+def _unchanged_container(note: str, content: str, type_note: str = "") -> str:
+    """Wrap already-escaped content in the no-changes redline container."""
+    return f'''
+<div class="redline-container">
+    {type_note}
+    <p class="redline-note">{note}</p>
+    <div class="redline-content">{content}</div>
+</div>
+'''
@@ -6,14 +6,17 @@ Fetches current statute text from official government sources:
 - CFR (Code of Federal Regulations) from eCFR.gov
 """
 
+import asyncio
 import logging
 import re
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import AsyncIterator, Dict, Optional, Tuple
 from bs4 import BeautifulSoup
 
 import httpx
+from cachetools import TTLCache
 
 from app.core.config import settings
 
@@ -36,6 +39,20 @@ class FetchedStatute:
 class StatuteFetcher(ABC):
     """Base class for statute fetchers."""
 
+    TIMEOUT = 30.0
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.client = client
+
+    @asynccontextmanager
+    async def _get_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared HTTP client, or a one-off client if none was given."""
+        if self.client is not None:
+            yield self.client
+        else:
+            async with httpx.AsyncClient(timeout=self.TIMEOUT, follow_redirects=True) as client:
+                yield client
+
     @abstractmethod
     async def fetch(self, title: int, section: str) -> FetchedStatute:
         """Fetch statute text for the given title and section."""
@@ -65,7 +82,8 @@ class GovInfoFetcher(StatuteFetcher):
     BASE_URL = "https://www.govinfo.gov/link/uscode"
     TIMEOUT = 30.0
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, client: Optional[httpx.AsyncClient] = None):
+        super().__init__(client)
         self.api_key = api_key or settings.GOVINFO_API_KEY
 
     async def fetch(self, title: int, section: str) -> FetchedStatute:
@@ -85,7 +103,7 @@ class GovInfoFetcher(StatuteFetcher):
         source_url = f"{url}?link-type=html"
 
         try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT, follow_redirects=True) as client:
+            async with self._get_client() as client:
                 response = await client.get(url, params=params)
 
                 if response.status_code == 404:
@@ -309,7 +327,7 @@ class ECFRFetcher(StatuteFetcher):
         source_url = html_url
 
         try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT, follow_redirects=True) as client:
+            async with self._get_client() as client:
                 # Try fetching the HTML page directly
                 response = await client.get(html_url)
 
@@ -462,9 +480,35 @@ class StatuteFetcherService:
             print(result.full_text)
     """
 
+    # Connection pool shared by all fetches; keeps TLS sessions to
+    # govinfo.gov and eCFR.gov alive between requests
+    TIMEOUT = 30.0
+    MAX_CONNECTIONS = 20
+
     def __init__(self):
-        self.usc_fetcher = GovInfoFetcher()
-        self.cfr_fetcher = ECFRFetcher()
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=self.TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.MAX_CONNECTIONS,
+                max_keepalive_connections=self.MAX_CONNECTIONS,
+            ),
+        )
+        self.usc_fetcher = GovInfoFetcher(client=self.client)
+        self.cfr_fetcher = ECFRFetcher(client=self.client)
+
+        # Successful fetches, keyed by (citation_type, title, section)
+        self._cache: TTLCache = TTLCache(
+            maxsize=settings.STATUTE_MEMORY_CACHE_SIZE,
+            ttl=settings.STATUTE_MEMORY_CACHE_SECONDS,
+        )
+        # In-flight fetches, so concurrent requests for one statute share a call
+        self._pending: Dict[Tuple[str, int, str], asyncio.Future] = {}
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        await self.client.aclose()
 
     async def fetch(self, citation_type: str, title: int, section: str) -> FetchedStatute:
         """
@@ -479,7 +523,30 @@ class StatuteFetcherService:
             FetchedStatute with the result
         """
         citation_type = citation_type.lower()
+        key = (citation_type, title, section)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_uncached(citation_type, title, section))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+
+        # Shield so one cancelled caller doesn't cancel the shared fetch
+        return await asyncio.shield(pending)
+
+    async def _fetch_uncached(self, citation_type: str, title: int, section: str) -> FetchedStatute:
+        """Fetch from the source API and cache the result if it succeeded."""
+        result = await self._fetch_from_source(citation_type, title, section)
+        if result.success:
+            self._cache[(citation_type, title, section)] = result
+        return result
 
+    async def _fetch_from_source(self, citation_type: str, title: int, section: str) -> FetchedStatute:
+        """Dispatch to the fetcher for the citation type."""
         if citation_type == "usc":
             return await self.usc_fetcher.fetch(title, section)
         elif citation_type == "cfr":
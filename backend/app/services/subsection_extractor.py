@@ -38,6 +38,9 @@ class ExtractionResult:
     extracted_text: str
     full_text: str  # Original full text
     error_message: Optional[str] = None
+    # Offsets of extracted_text within full_text (full_text[start_pos:end_pos])
+    start_pos: int = 0
+    end_pos: int = 0
 
 
 class SubsectionExtractor:
@@ -110,7 +113,9 @@ class SubsectionExtractor:
                 success=True,
                 subsection_notation="",
                 extracted_text=full_text,
-                full_text=full_text
+                full_text=full_text,
+                start_pos=0,
+                end_pos=len(full_text)
             )
 
         # Parse the subsection notation into components
@@ -127,14 +132,17 @@ class SubsectionExtractor:
         logger.debug(f"Extracting subsection {subsection} with components: {components}")
 
         # Navigate through the text to find the target subsection
-        extracted = self._extract_nested(full_text, components)
+        span = self._extract_nested(full_text, components)
 
-        if extracted:
+        if span and span[1] > span[0]:
+            start, end = span
             return ExtractionResult(
                 success=True,
                 subsection_notation=subsection,
-                extracted_text=extracted,
-                full_text=full_text
+                extracted_text=full_text[start:end],
+                full_text=full_text,
+                start_pos=start,
+                end_pos=end
             )
         else:
             return ExtractionResult(
@@ -158,71 +166,85 @@ class SubsectionExtractor:
         matches = re.findall(r'\(([^)]+)\)', notation)
         return matches
 
-    def _extract_nested(self, text: str, components: List[str]) -> Optional[str]:
+    def _extract_nested(self, text: str, components: List[str]) -> Optional[Tuple[int, int]]:
         """
-        Extract text by navigating through nested subsection markers.
+        Locate text by navigating through nested subsection markers.
 
-        For each component, find the marker and extract text until the next
-        marker at the same or higher level.
+        For each component, find the marker and narrow the window to the
+        text before the next marker at the same or higher level. The window
+        is tracked as offsets into the full text, so nothing is copied until
+        the final slice.
+
+        Returns:
+            (start, end) offsets of the stripped subsection, or None
         """
-        current_text = text
-        remaining_components = list(components)
+        lo, hi = 0, len(text)
 
-        while remaining_components:
-            component = remaining_components.pop(0)
+        for component in components:
             marker = f"({component})"
 
-            # Find the marker in current text
-            marker_pos = self._find_marker(current_text, marker)
+            # Find the marker in the current window
+            marker_pos = self._find_marker(text, marker, lo, hi)
             if marker_pos == -1:
                 logger.debug(f"Could not find marker {marker}")
                 return None
 
-            # Extract from marker to the end of this subsection
-            start = marker_pos
-            end = self._find_subsection_end(current_text, start, component)
+            # Narrow from the marker to the end of this subsection
+            lo = marker_pos
+            hi = self._find_subsection_end(text, lo, component, hi)
 
-            current_text = current_text[start:end].strip()
+            # Strip surrounding whitespace
+            while lo < hi and text[lo].isspace():
+                lo += 1
+            while hi > lo and text[hi - 1].isspace():
+                hi -= 1
 
-        return current_text
+        return lo, hi
 
-    def _find_marker(self, text: str, marker: str) -> int:
+    def _find_marker(self, text: str, marker: str, start: int = 0, end: Optional[int] = None) -> int:
         """
-        Find a subsection marker in text, handling edge cases.
+        Find a subsection marker in text[start:end], handling edge cases.
 
         The marker should appear at the start of a subsection, typically:
         - After a newline
         - After a period and space
         - At paragraph boundaries
+
+        Returns:
+            Absolute position of the marker in text, or -1
         """
+        if end is None:
+            end = len(text)
+
         # Try exact match first
-        pos = text.find(marker)
+        pos = text.find(marker, start, end)
         if pos != -1:
             return pos
 
         # Try case-insensitive for letter markers
-        marker_lower = marker.lower()
-        text_lower = text.lower()
-        pos = text_lower.find(marker_lower)
-        if pos != -1:
-            return pos
+        match = re.compile(re.escape(marker), re.IGNORECASE).search(text, start, end)
+        if match:
+            return match.start()
 
         return -1
 
-    def _find_subsection_end(self, text: str, start: int, component: str) -> int:
+    def _find_subsection_end(self, text: str, start: int, component: str, end: Optional[int] = None) -> int:
         """
-        Find where a subsection ends.
+        Find where a subsection ends within text[:end].
 
         A subsection ends when:
         - We hit the next marker at the same level
         - We hit a marker at a higher level (less nested)
-        - We reach the end of the text
+        - We reach the end of the text (or window)
         """
+        if end is None:
+            end = len(text)
+
         level = self._get_marker_level(component)
         search_start = start + len(f"({component})")
 
         # Find all markers after our position
-        for match in self.ANY_MARKER_PATTERN.finditer(text[search_start:]):
+        for match in self.ANY_MARKER_PATTERN.finditer(text, search_start, end):
             match_component = match.group(1)
             match_level = self._get_marker_level(match_component)
 
@@ -230,13 +252,13 @@ class SubsectionExtractor:
             if match_level <= level:
                 # Check if it's the next marker in sequence at same level
                 if match_level == level and self._is_next_in_sequence(component, match_component):
-                    return search_start + match.start()
+                    return match.start()
                 # Higher level marker means parent section ended
                 elif match_level < level:
-                    return search_start + match.start()
+                    return match.start()
 
         # No end marker found, return end of text
-        return len(text)
+        return end
 
     def _get_marker_level(self, component: str) -> int:
         """
@@ -9,6 +9,7 @@ Tests:
 5. Designate patterns - new (Phase 2)
 """
 
+import dataclasses
 import pytest
 import sys
 import os
@@ -16,7 +17,12 @@ import os
 # Add the app directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from app.services.amendment_parser import AmendmentParser, AmendmentType
+from app.services.amendment_parser import (
+    AmendmentApplier,
+    AmendmentParser,
+    AmendmentType,
+    ParsedAmendment,
+)
 
 
 class TestQuoteNormalization:
@@ -128,6 +134,22 @@ class TestExistingPatterns:
         result = parser.parse(text)
         assert result.success is True
 
+    def test_unbalanced_quote_keeps_following_deleting(self):
+        """An unclosed quote after 'striking' doesn't hide a later 'deleting'."""
+        parser = AmendmentParser()
+        text = 'Section 5 is amended by striking "the Secretary and by deleting "annual" '
+        result = parser.parse(text)
+        struck = [a.text_to_strike for a in result.amendments if a.amendment_type == AmendmentType.STRIKE]
+        assert struck == ["the Secretary and by deleting", "annual"]
+
+    def test_unbalanced_quote_keeps_following_striking(self):
+        """An unclosed quote after 'deleting' doesn't hide a later 'striking'."""
+        parser = AmendmentParser()
+        text = 'by deleting "and by striking "bar" at the end'
+        result = parser.parse(text)
+        struck = {a.text_to_strike for a in result.amendments if a.amendment_type == AmendmentType.STRIKE}
+        assert struck == {"and by striking", "bar"}
+
 
 class TestEdgeCases:
     """Test edge cases and potential issues."""
@@ -156,6 +178,44 @@ class TestEdgeCases:
         # Should detect the amendment despite the definitional text
         assert result.success is True
 
+    def test_classify_definitional(self):
+        """Test that classify flags definitional text without parsing it."""
+        parser = AmendmentParser()
+        text = "The term 'eligible entity' has the meaning given in section 501(c)(3)"
+        result = parser.classify(text)
+        assert result.is_definitional is True
+        assert result.is_amendment is False
+        assert result.parse_result is None
+
+    def test_classify_matches_parse(self):
+        """Test that classify returns the same amendments as parse."""
+        parser = AmendmentParser()
+        text = """The term 'eligible entity' has the meaning given in section 501.
+        Section 502 is amended by striking “old” and inserting “new”."""
+        result = parser.classify(text)
+        assert result.is_definitional is False
+        assert result.is_amendment is True
+        assert result.parse_result == parser.parse(text)
+
+    def test_parse_reuses_result_for_same_text(self):
+        """Test that repeated text is served from the parse cache."""
+        parser = AmendmentParser()
+        text = 'Section 2 is amended by striking "old" and inserting "new".'
+        first = parser.parse(text)
+        assert parser.parse(text) is first
+        assert parser.parse(text.replace("old", "older")) is not first
+
+    def test_cached_result_is_immutable(self):
+        """Test that a shared parse result cannot be changed by a caller."""
+        parser = AmendmentParser()
+        text = 'Section 2(a) is amended by striking "old" and inserting "new".'
+        result = parser.parse(text)
+        assert isinstance(result.amendments, tuple)
+        assert result.amendments[0].target_section == "Section 2(a)"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.amendments[0].text_to_insert = "changed"
+        assert parser.parse(text).amendments[0].text_to_insert == "new"
+
 
 # =============================================================================
 # Phase 2 Tests: Redesignate and Designate Patterns
@@ -343,5 +403,117 @@ class TestParagraphReplacementWithNewlines:
         assert len(amendments) >= 1
 
 
+class TestAmendmentApplier:
+    """Test applying parsed amendments to statute text."""
+
+    def test_apply_batch_applies_in_order(self):
+        """Later amendments see the text produced by earlier ones."""
+        applier = AmendmentApplier()
+        amendments = [
+            ParsedAmendment(
+                amendment_type=AmendmentType.STRIKE_INSERT,
+                text_to_strike="$100",
+                text_to_insert="$200",
+            ),
+            ParsedAmendment(
+                amendment_type=AmendmentType.INSERT_AFTER,
+                position_marker="$200",
+                text_to_insert="per year",
+            ),
+            ParsedAmendment(
+                amendment_type=AmendmentType.STRIKE,
+                text_to_strike="missing text",
+            ),
+        ]
+        text, results = applier.apply_batch("A fee of $100 is charged.", amendments)
+        assert text == "A fee of $200 per year is charged."
+        assert results == [True, True, False]
+
+    def test_case_insensitive_match_keeps_original_text(self):
+        """A marker differing only in case is found and the text around it is kept."""
+        applier = AmendmentApplier()
+        amendment = ParsedAmendment(
+            amendment_type=AmendmentType.INSERT_AFTER,
+            position_marker="the secretary—",
+            text_to_insert="acting through the Chief,",
+        )
+        text, success = applier.apply("(a) The Secretary— shall act.", amendment)
+        assert success is True
+        assert text == "(a) The Secretary— acting through the Chief, shall act."
+
+    def test_apply_all_joins_independent_edits(self, monkeypatch):
+        """Independent literal edits are joined in one pass with the sequential result."""
+        applier = AmendmentApplier()
+        original = "The Secretary shall pay $100 to each State for each fiscal year."
+        amendments = [
+            ParsedAmendment(
+                amendment_type=AmendmentType.STRIKE_INSERT,
+                text_to_strike="$100",
+                text_to_insert="$250",
+            ),
+            ParsedAmendment(
+                amendment_type=AmendmentType.STRIKE_INSERT,
+                text_to_strike="Secretary",
+                text_to_insert="Administrator",
+            ),
+            ParsedAmendment(
+                amendment_type=AmendmentType.INSERT_BEFORE,
+                position_marker="fiscal",
+                text_to_insert="full",
+            ),
+        ]
+        expected = applier.apply_batch(original, amendments)
+        monkeypatch.setattr(applier, "apply_batch", lambda *args: pytest.fail("fell back"))
+        assert applier.apply_all(original, amendments) == expected
+        assert expected[0] == "The Administrator shall pay $250 to each State for each full fiscal year."
+
+    def test_apply_all_falls_back_when_edit_creates_later_match(self):
+        """A later amendment may match text an earlier one inserts, as in sequence."""
+        applier = AmendmentApplier()
+        original = "A fee and a tax apply."
+        amendments = [
+            ParsedAmendment(
+                amendment_type=AmendmentType.STRIKE_INSERT,
+                text_to_strike="fee",
+                text_to_insert="tax",
+            ),
+            ParsedAmendment(
+                amendment_type=AmendmentType.STRIKE,
+                text_to_strike="tax",
+            ),
+        ]
+        assert applier.apply_all(original, amendments) == ("A  and a tax apply.", [True, True])
+
+    def test_apply_all_falls_back_when_strike_joins_later_match(self):
+        """Removing text can join its neighbours into an earlier match."""
+        applier = AmendmentApplier()
+        original = "xa-by ab"
+        amendments = [
+            ParsedAmendment(amendment_type=AmendmentType.STRIKE, text_to_strike="-"),
+            ParsedAmendment(amendment_type=AmendmentType.STRIKE, text_to_strike="ab"),
+        ]
+        assert applier.apply_all(original, amendments) == applier.apply_batch(original, amendments)
+        assert applier.apply_all(original, amendments)[0] == "xy ab"
+
+    def test_apply_all_falls_back_for_overlapping_edits(self):
+        """An amendment editing text inserted by an earlier one is applied in sequence."""
+        applier = AmendmentApplier()
+        amendments = [
+            ParsedAmendment(
+                amendment_type=AmendmentType.STRIKE_INSERT,
+                text_to_strike="$100",
+                text_to_insert="$200",
+            ),
+            ParsedAmendment(
+                amendment_type=AmendmentType.STRIKE_INSERT,
+                text_to_strike="$",
+                text_to_insert="USD ",
+            ),
+        ]
+        text, results = applier.apply_all("A fee of $100.", amendments)
+        assert text == "A fee of USD 200."
+        assert results == [True, True]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,71 @@
+"""
+Tests for Statute Fetcher
+
+Tests:
+1. Fetchers without a shared client open their own per request
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+
+import httpx
+
+# Add the app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.statute_fetcher import ECFRFetcher, GovInfoFetcher
+
+
+USC_HTML = (
+    "<html><body>"
+    "<h3 class=\"section-head\">§ 1. Definitions</h3>"
+    "<!-- field-start:statute -->"
+    "<p class=\"statutory-body\">In this chapter, the term 'farm' means a farm.</p>"
+    "<!-- field-end:statute -->"
+    "</body></html>"
+)
+
+
+@pytest.fixture
+def mock_transport(monkeypatch):
+    """Route clients created by the fetchers through a mocked transport."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.host == "www.govinfo.gov":
+            return httpx.Response(200, text=USC_HTML)
+        return httpx.Response(404)
+
+    client_class = httpx.AsyncClient
+
+    def client_factory(*args, **kwargs):
+        return client_class(*args, transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", client_factory)
+    return requests
+
+
+class TestStandaloneFetchers:
+    """Test fetchers constructed without a shared HTTP client."""
+
+    def test_govinfo_fetch_without_shared_client(self, mock_transport):
+        """A standalone fetcher opens a one-off client for the request."""
+        result = asyncio.run(GovInfoFetcher(api_key="").fetch(7, "1"))
+        assert result.success is True
+        assert result.heading == "§ 1. Definitions"
+        assert "the term 'farm'" in result.full_text
+        assert len(mock_transport) == 1
+
+    def test_ecfr_fetch_without_shared_client(self, mock_transport):
+        """Responses from the one-off client are reported, not a client error."""
+        result = asyncio.run(ECFRFetcher().fetch(7, "1.1"))
+        assert result.success is False
+        assert result.error_message == "Section not found: 7 C.F.R. § 1.1"
+        assert len(mock_transport) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
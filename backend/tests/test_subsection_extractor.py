@@ -0,0 +1,85 @@
+"""
+Tests for Subsection Extractor
+
+Tests:
+1. Nested subsection extraction
+2. Offsets of the extracted text within the full statute
+3. Missing subsections
+"""
+
+import pytest
+import sys
+import os
+
+# Add the app directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.subsection_extractor import SubsectionExtractor
+
+
+STATUTE_TEXT = (
+    "(a) In general.—The Secretary shall make payments to producers.\n"
+    "(b) Limitation.—\n"
+    "(1) In general.—No payment shall exceed $125,000.\n"
+    "(2) Exception.—\n"
+    "(A) The limitation does not apply to cooperatives.\n"
+    "(B) The limitation does not apply to tribes.\n"
+    "(c) Definitions.—In this section, the term 'producer' means an owner.\n"
+)
+
+
+class TestSubsectionExtraction:
+    """Test extraction of nested subsections."""
+
+    def test_top_level_subsection(self):
+        """Test extracting a top-level subsection."""
+        extractor = SubsectionExtractor()
+        result = extractor.extract(STATUTE_TEXT, "(a)")
+        assert result.success
+        assert result.extracted_text == "(a) In general.—The Secretary shall make payments to producers."
+
+    def test_nested_subsection(self):
+        """Test extracting a subparagraph nested two levels deep."""
+        extractor = SubsectionExtractor()
+        result = extractor.extract(STATUTE_TEXT, "(b)(2)(B)")
+        assert result.success
+        assert result.extracted_text == "(B) The limitation does not apply to tribes."
+
+    def test_subsection_includes_children(self):
+        """Test that a subsection includes its paragraphs up to the next subsection."""
+        extractor = SubsectionExtractor()
+        result = extractor.extract(STATUTE_TEXT, "(b)")
+        assert result.success
+        assert result.extracted_text.startswith("(b) Limitation.")
+        assert "(2) Exception" in result.extracted_text
+        assert "(c)" not in result.extracted_text
+
+    def test_missing_subsection(self):
+        """Test that an absent subsection reports failure."""
+        extractor = SubsectionExtractor()
+        result = extractor.extract(STATUTE_TEXT, "(b)(3)")
+        assert not result.success
+        assert result.extracted_text == ""
+
+
+class TestExtractionOffsets:
+    """Test that results report where the text sits in the full statute."""
+
+    @pytest.mark.parametrize("notation", ["(a)", "(b)", "(b)(1)", "(b)(2)(A)", "(c)"])
+    def test_offsets_match_extracted_text(self, notation):
+        """Test that full_text[start_pos:end_pos] is the extracted text."""
+        extractor = SubsectionExtractor()
+        result = extractor.extract(STATUTE_TEXT, notation)
+        assert result.success
+        assert STATUTE_TEXT[result.start_pos:result.end_pos] == result.extracted_text
+
+    def test_no_notation_spans_full_text(self):
+        """Test that an empty notation returns the whole text."""
+        extractor = SubsectionExtractor()
+        result = extractor.extract(STATUTE_TEXT, "")
+        assert result.success
+        assert (result.start_pos, result.end_pos) == (0, len(STATUTE_TEXT))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
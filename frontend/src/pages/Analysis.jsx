@@ -4,6 +4,10 @@ import { useQuery, useMutation } from '@tanstack/react-query'
 import CitationList from '../components/CitationList'
 import { documentApi, citationApi } from '../services/api'
 
+// Poll every second for up to five minutes while comparisons are generated
+const COMPARE_POLL_INTERVAL_MS = 1000
+const COMPARE_POLL_MAX_ATTEMPTS = 300
+
 function Analysis() {
   const { documentId } = useParams()
   const navigate = useNavigate()
@@ -37,9 +41,39 @@ function Analysis() {
     }
   }
 
-  // Generate comparison
+  // Fetch all unfetched statutes in one request
+  const handleFetchAll = async () => {
+    const pendingIds = citations.filter((c) => !c.statute_fetched).map((c) => c.id)
+    setFetchingCitations((prev) => [...prev, ...pendingIds])
+    try {
+      await documentApi.fetchAllStatutes(documentId)
+      citationsQuery.refetch()
+    } catch (err) {
+      console.error('Failed to fetch statutes:', err)
+    } finally {
+      setFetchingCitations((prev) => prev.filter((id) => !pendingIds.includes(id)))
+    }
+  }
+
+  // Generate comparison; the server builds it in the background, so poll
+  // the document until it leaves the processing state
   const compareMutation = useMutation({
-    mutationFn: () => documentApi.compare(documentId),
+    mutationFn: async () => {
+      let document = await documentApi.compare(documentId)
+      let attempts = 0
+      while (document.status === 'processing') {
+        if (attempts >= COMPARE_POLL_MAX_ATTEMPTS) {
+          throw new Error('Comparison is taking longer than expected. Please try again later.')
+        }
+        attempts += 1
+        await new Promise((resolve) => setTimeout(resolve, COMPARE_POLL_INTERVAL_MS))
+        document = await documentApi.get(documentId)
+      }
+      if (document.status === 'failed') {
+        throw new Error(document.error_message || 'Failed to generate comparison')
+      }
+      return document
+    },
     onSuccess: () => {
       navigate(`/comparison/${documentId}`)
     },
@@ -91,13 +125,7 @@ function Analysis() {
               <div className="flex items-center justify-between">
                 <h2 className="font-semibold text-gray-900">Detected Citations</h2>
                 <button
-                  onClick={() => {
-                    citations.forEach((c) => {
-                      if (!c.statute_fetched) {
-                        handleFetchStatute(c.id)
-                      }
-                    })
-                  }}
+                  onClick={handleFetchAll}
                   disabled={allFetched || fetchingCitations.length > 0}
                   className="px-4 py-2 text-sm bg-blue-600 text-white rounded-lg hover:bg-blue-700 disabled:opacity-50"
                 >
@@ -127,6 +155,11 @@ function Analysis() {
                 Fetch all statutes before generating comparison
               </p>
             )}
+            {compareMutation.isError && (
+              <p className="mt-2 text-sm text-red-600">
+                {compareMutation.error.message}
+              </p>
+            )}
           </div>
         </>
       )}
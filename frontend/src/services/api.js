@@ -27,11 +27,21 @@ export const documentApi = {
     return response.data
   },
 
+  get: async (documentId) => {
+    const response = await api.get(`/documents/${documentId}`)
+    return response.data
+  },
+
   getCitations: async (documentId) => {
     const response = await api.get(`/documents/${documentId}/citations`)
     return response.data
   },
 
+  fetchAllStatutes: async (documentId) => {
+    const response = await api.post(`/documents/${documentId}/fetch-all-statutes`)
+    return response.data
+  },
+
   compare: async (documentId) => {
     const response = await api.post(`/documents/${documentId}/compare`)
     return response.data